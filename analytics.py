@@ -0,0 +1,452 @@
+"""
+TalentScout Hiring Assistant - Screening Analytics
+This module keeps a columnar, in-memory store of completed screenings and
+computes live aggregates for recruiters with NumPy.
+
+Each screening is one row: completion time, experience in years (parsed with
+the same rules as the experience validator, NaN when unparseable), and
+categorical codes for position and location. Tech stacks are multi-valued and
+stored as a flat column of technology codes with per-row offsets.
+
+NOTE: The store is in-memory only and never written to disk. Rows older than
+the retention window are expired, and no names or contact details are kept.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from utils import normalize_tech_name, parse_experience, parse_tech_stack
+
+DEFAULT_RETENTION_SECONDS = 24 * 3600
+DEFAULT_EXPERIENCE_BINS = (0, 1, 3, 5, 10, 20, 50)
+MIN_CAPACITY = 1024
+UNKNOWN = -1
+POSITION_STRIDE = 1024.0
+
+
+class _Column:
+    """
+    Growable NumPy array with amortized O(1) appends.
+    """
+
+    def __init__(self, dtype):
+        self.data = np.empty(MIN_CAPACITY, dtype=dtype)
+        self.size = 0
+
+    def extend(self, values: Sequence):
+        """
+        Append values, doubling the capacity when full.
+
+        Args:
+            values: Values to append
+        """
+        count = len(values)
+        if self.size + count > len(self.data):
+            capacity = max(len(self.data) * 2, self.size + count)
+            grown = np.empty(capacity, dtype=self.data.dtype)
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+        self.data[self.size:self.size + count] = values
+        self.size += count
+
+    def values(self) -> np.ndarray:
+        """
+        Get a view of the stored values.
+        """
+        return self.data[:self.size]
+
+    def drop_prefix(self, count: int):
+        """
+        Discard the first values, releasing memory.
+
+        Args:
+            count: Number of leading values to drop
+        """
+        remaining = self.data[count:self.size]
+        self.data = np.empty(max(MIN_CAPACITY, len(remaining) * 2), dtype=self.data.dtype)
+        self.data[:len(remaining)] = remaining
+        self.size = len(remaining)
+
+
+class _Categories:
+    """
+    Dictionary encoding of a categorical column.
+    """
+
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.names: List[str] = []
+
+    def encode(self, key: str, name: str) -> int:
+        """
+        Get the code for a category, adding it on first use.
+
+        Args:
+            key: Normalized category key
+            name: Display name used when the category is new
+
+        Returns:
+            Integer code
+        """
+        code = self.codes.get(key)
+        if code is None:
+            code = len(self.names)
+            self.codes[key] = code
+            self.names.append(name)
+        return code
+
+    def prune(self, column: np.ndarray):
+        """
+        Drop categories no longer referenced by a column and renumber the rest,
+        rewriting the column's codes in place.
+
+        Args:
+            column: Live codes of the categorical column
+        """
+        known = column != UNKNOWN
+        used = np.zeros(len(self.names), dtype=bool)
+        used[column[known]] = True
+        kept = np.flatnonzero(used)
+        remap = np.full(len(self.names), UNKNOWN, dtype=column.dtype)
+        remap[kept] = np.arange(len(kept), dtype=column.dtype)
+
+        column[known] = remap[column[known]]
+        self.codes = {key: int(remap[code]) for key, code in self.codes.items() if used[code]}
+        self.names = [self.names[code] for code in kept]
+
+
+def _text_key(value) -> str:
+    """
+    Normalize free text such as a position or location for grouping.
+
+    Args:
+        value: Raw value
+
+    Returns:
+        Lowercase text with collapsed whitespace, empty if missing
+    """
+    return ' '.join(str(value or '').lower().split())
+
+
+class CandidateAnalytics:
+    """
+    Thread-safe columnar store of completed screenings with aggregate queries.
+
+    Rows are appended in completion order, so expiry and time filters are a
+    binary search on the timestamp column; expired rows are compacted away once
+    they make up half of the store, along with categories only they used.
+    """
+
+    def __init__(self, retention_seconds: float = DEFAULT_RETENTION_SECONDS,
+                 clock: Callable[[], float] = time.time):
+        """
+        Initialize an empty store.
+
+        Args:
+            retention_seconds: Seconds a screening is kept after completion
+            clock: Time source in seconds, injectable for tests
+        """
+        self.retention_seconds = retention_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._timestamps = _Column(np.float64)
+        self._experience = _Column(np.float64)
+        self._positions = _Column(np.int32)
+        self._locations = _Column(np.int32)
+        self._tech_offsets = _Column(np.int64)
+        self._tech_codes = _Column(np.int32)
+
+        self.positions = _Categories()
+        self.locations = _Categories()
+        self.technologies = _Categories()
+
+        self._start = 0
+        self.expired = 0
+
+    def add(self, candidate_data: Dict, timestamp: Optional[float] = None):
+        """
+        Append one completed screening.
+
+        Args:
+            candidate_data: Collected candidate fields
+            timestamp: Completion time; defaults to now
+        """
+        self.add_many([candidate_data], None if timestamp is None else [timestamp])
+
+    def add_many(self, records: Sequence[Dict], timestamps: Optional[Sequence[float]] = None):
+        """
+        Append several completed screenings.
+
+        Args:
+            records: Collected candidate fields per screening
+            timestamps: Completion time per screening; defaults to now
+        """
+        if not records:
+            return
+
+        experience = []
+        positions = []
+        locations = []
+        tech_counts = []
+        tech_codes = []
+
+        with self._lock:
+            for record in records:
+                years = parse_experience(str(record.get('experience', '')))
+                experience.append(np.nan if years is None else years)
+
+                position = _text_key(record.get('position'))
+                positions.append(self.positions.encode(position, str(record['position']).strip())
+                                 if position else UNKNOWN)
+                location = _text_key(record.get('location'))
+                locations.append(self.locations.encode(location, str(record['location']).strip())
+                                 if location else UNKNOWN)
+
+                stack = record.get('tech_stack') or []
+                if isinstance(stack, str):
+                    stack = parse_tech_stack(stack)
+                codes = set()
+                for tech in stack:
+                    name = normalize_tech_name(tech) or tech.strip()
+                    if name:
+                        codes.add(self.technologies.encode(name.lower(), name))
+                tech_counts.append(len(codes))
+                tech_codes.extend(codes)
+
+            now = self._clock()
+            timestamps = np.asarray([now] * len(records) if timestamps is None else timestamps, dtype=np.float64)
+            if self._timestamps.size:
+                timestamps = np.maximum(timestamps, self._timestamps.data[self._timestamps.size - 1])
+            timestamps = np.maximum.accumulate(timestamps)
+
+            offsets = self._tech_codes.size + np.concatenate(([0], np.cumsum(tech_counts)[:-1]))
+            self._timestamps.extend(timestamps)
+            self._experience.extend(experience)
+            self._positions.extend(positions)
+            self._locations.extend(locations)
+            self._tech_offsets.extend(offsets)
+            self._tech_codes.extend(tech_codes)
+
+            self._expire(now)
+
+    def _expire(self, now: float):
+        """
+        Advance past rows older than the retention window, compacting when worthwhile.
+
+        Args:
+            now: Current time
+        """
+        cutoff = now - self.retention_seconds
+        start = int(np.searchsorted(self._timestamps.values(), cutoff, side='right'))
+        if start <= self._start:
+            return
+
+        self.expired += start - self._start
+        self._start = start
+
+        if self._start >= MIN_CAPACITY and self._start * 2 >= self._timestamps.size:
+            tech_start = self._tech_offset(self._start)
+            for column in (self._timestamps, self._experience, self._positions,
+                           self._locations, self._tech_offsets):
+                column.drop_prefix(self._start)
+            self._tech_codes.drop_prefix(tech_start)
+            self._tech_offsets.values()[:] -= tech_start
+            self._start = 0
+
+            self.positions.prune(self._positions.values())
+            self.locations.prune(self._locations.values())
+            self.technologies.prune(self._tech_codes.values())
+
+    def _tech_offset(self, row: int) -> int:
+        """
+        Get the position in the technology column where a row's codes begin.
+
+        Args:
+            row: Row index
+
+        Returns:
+            Offset into the technology code column
+        """
+        if row < self._tech_offsets.size:
+            return int(self._tech_offsets.data[row])
+        return self._tech_codes.size
+
+    def _window(self, since: Optional[float]) -> Tuple[int, int]:
+        """
+        Expire old rows and find the first row and technology entry to aggregate.
+
+        Args:
+            since: Optional earliest completion time to include
+
+        Returns:
+            Tuple of (first row, first technology entry)
+        """
+        self._expire(self._clock())
+        start = self._start
+        if since is not None:
+            start = max(start, int(np.searchsorted(self._timestamps.values(), since, side='left')))
+        return start, self._tech_offset(start)
+
+    def count(self, since: Optional[float] = None) -> int:
+        """
+        Count live screenings.
+
+        Args:
+            since: Optional earliest completion time to include
+
+        Returns:
+            Number of screenings
+        """
+        with self._lock:
+            start, _ = self._window(since)
+            return self._timestamps.size - start
+
+    def top_technologies(self, n: int = 10, since: Optional[float] = None) -> List[Tuple[str, int]]:
+        """
+        Get the most common technologies.
+
+        Args:
+            n: Number of technologies to return
+            since: Optional earliest completion time to include
+
+        Returns:
+            List of (technology, candidate count), most common first
+        """
+        with self._lock:
+            _, tech_start = self._window(since)
+            counts = np.bincount(self._tech_codes.values()[tech_start:], minlength=len(self.technologies.names))
+            names = self.technologies.names
+        return _ranked(counts, names, n)
+
+    def location_counts(self, n: Optional[int] = None, since: Optional[float] = None) -> List[Tuple[str, int]]:
+        """
+        Count screenings per location.
+
+        Args:
+            n: Optional number of locations to return
+            since: Optional earliest completion time to include
+
+        Returns:
+            List of (location, candidate count), most common first
+        """
+        with self._lock:
+            start, _ = self._window(since)
+            codes = self._locations.values()[start:]
+            counts = np.bincount(codes[codes != UNKNOWN], minlength=len(self.locations.names))
+            names = self.locations.names
+        return _ranked(counts, names, n)
+
+    def experience_by_position(self, since: Optional[float] = None) -> Dict[str, Dict]:
+        """
+        Summarize the experience distribution per position.
+
+        Args:
+            since: Optional earliest completion time to include
+
+        Returns:
+            Position to dictionary of count, mean, min, p25, median, p75 and max years
+        """
+        with self._lock:
+            start, _ = self._window(since)
+            positions = self._positions.values()[start:]
+            experience = self._experience.values()[start:]
+            names = self.positions.names
+
+        valid = (positions != UNKNOWN) & ~np.isnan(experience)
+        positions = positions[valid]
+        experience = experience[valid]
+        if not len(positions):
+            return {}
+
+        # Experience is bounded by parse_experience, so one float sort on a
+        # composite key orders rows by position, then years.
+        composite = np.sort(positions * POSITION_STRIDE + experience)
+        positions = (composite // POSITION_STRIDE).astype(np.int64)
+        experience = composite - positions * POSITION_STRIDE
+        codes, starts, counts = np.unique(positions, return_index=True, return_counts=True)
+        means = np.add.reduceat(experience, starts) / counts
+
+        def quantile(q: float) -> np.ndarray:
+            rank = q * (counts - 1)
+            low = np.floor(rank).astype(np.int64)
+            high = np.ceil(rank).astype(np.int64)
+            lower = experience[starts + low]
+            return lower + (experience[starts + high] - lower) * (rank - low)
+
+        p25, median, p75 = quantile(0.25), quantile(0.5), quantile(0.75)
+        maxima = experience[starts + counts - 1]
+
+        return {
+            names[code]: {
+                'count': int(counts[i]),
+                'mean': float(means[i]),
+                'min': float(experience[starts[i]]),
+                'p25': float(p25[i]),
+                'median': float(median[i]),
+                'p75': float(p75[i]),
+                'max': float(maxima[i]),
+            }
+            for i, code in enumerate(codes)
+        }
+
+    def experience_histogram(self, bins: Sequence[float] = DEFAULT_EXPERIENCE_BINS,
+                             since: Optional[float] = None) -> List[Tuple[str, int]]:
+        """
+        Count screenings per experience range.
+
+        Args:
+            bins: Increasing bin edges in years
+            since: Optional earliest completion time to include
+
+        Returns:
+            List of (range label, candidate count)
+        """
+        with self._lock:
+            start, _ = self._window(since)
+            experience = self._experience.values()[start:]
+
+        counts, edges = np.histogram(experience[~np.isnan(experience)], bins=bins)
+        return [(f"{edges[i]:g}-{edges[i + 1]:g} years", int(count)) for i, count in enumerate(counts)]
+
+    def stats(self) -> Dict:
+        """
+        Get store size counters.
+
+        Returns:
+            Dictionary with live and expired rows, category counts and memory used
+        """
+        with self._lock:
+            self._expire(self._clock())
+            columns = (self._timestamps, self._experience, self._positions,
+                       self._locations, self._tech_offsets, self._tech_codes)
+            return {
+                'rows': self._timestamps.size - self._start,
+                'expired': self.expired,
+                'technologies': len(self.technologies.names),
+                'positions': len(self.positions.names),
+                'locations': len(self.locations.names),
+                'memory_bytes': sum(column.data.nbytes for column in columns),
+                'retention_seconds': self.retention_seconds,
+            }
+
+
+def _ranked(counts: np.ndarray, names: List[str], n: Optional[int]) -> List[Tuple[str, int]]:
+    """
+    Rank categories by count, dropping empty ones.
+
+    Args:
+        counts: Count per category code
+        names: Display name per category code
+        n: Optional number of categories to return
+
+    Returns:
+        List of (name, count), most common first
+    """
+    order = np.argsort(-counts, kind='stable')
+    if n is not None:
+        order = order[:n]
+    return [(names[code], int(counts[code])) for code in order if counts[code] > 0]
@@ -0,0 +1,239 @@
+"""
+TalentScout Hiring Assistant - Local Answer Scoring
+This module parses generated questions with their expected-concept keywords
+and scores candidate answers against them without any LLM call.
+
+Answers are reduced to a sparse bag of vocabulary terms (up to trigrams); each
+(question, keyword) pair is encoded as a single integer so a whole batch of
+answers is scored with one NumPy membership test and one bincount.
+"""
+
+import re
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+HEADING_PATTERN = re.compile(r'^\s*\*\*(.+?)\*\*\s*$')
+QUESTION_PATTERN = re.compile(r'^\s*(\d+)[.)]\s+(.*\S)\s*$')
+KEYWORDS_PATTERN = re.compile(r'^\s*[-*]?\s*Keywords?\s*:\s*(.+)$', re.IGNORECASE)
+TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*')
+
+MAX_NGRAM = 3
+MAX_FALLBACK_KEYWORDS = 6
+
+STOPWORDS = frozenset([
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'between', 'by', 'can', 'could', 'describe',
+    'do', 'does', 'explain', 'for', 'from', 'how', 'i', 'if', 'in', 'into', 'is', 'it',
+    'its', 'of', 'on', 'or', 'that', 'the', 'their', 'this', 'to', 'used', 'using',
+    'what', 'when', 'where', 'which', 'why', 'with', 'would', 'you', 'your',
+])
+
+
+def _normalize_token(token: str) -> str:
+    """
+    Apply light stemming so plural and singular forms match.
+
+    Args:
+        token: Lowercase token
+
+    Returns:
+        Normalized token
+    """
+    if len(token) > 4 and token.endswith('ies'):
+        return token[:-3] + 'y'
+    if len(token) > 4 and token.endswith('s') and not token.endswith('ss'):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into normalized lowercase tokens, keeping names like c++, c# and node.js.
+
+    Args:
+        text: Input text
+
+    Returns:
+        List of tokens
+    """
+    return [_normalize_token(token) for token in TOKEN_PATTERN.findall(text.lower())]
+
+
+def keyword_term(keyword: str) -> str:
+    """
+    Normalize a keyword phrase into a single term of up to MAX_NGRAM tokens.
+
+    Args:
+        keyword: Keyword or short phrase
+
+    Returns:
+        Normalized term, empty if the keyword has no tokens
+    """
+    return ' '.join(tokenize(keyword)[:MAX_NGRAM])
+
+
+def answer_terms(answer: str) -> set:
+    """
+    Build the bag of terms of an answer: all n-grams up to MAX_NGRAM tokens.
+
+    Args:
+        answer: Candidate answer
+
+    Returns:
+        Set of terms
+    """
+    tokens = tokenize(answer)
+    terms = set()
+    for n in range(1, MAX_NGRAM + 1):
+        for i in range(len(tokens) - n + 1):
+            terms.add(' '.join(tokens[i:i + n]))
+    return terms
+
+
+def _fallback_keywords(question: str) -> List[str]:
+    """
+    Derive keywords from the question itself when none were generated.
+
+    Args:
+        question: Question text
+
+    Returns:
+        Content words of the question
+    """
+    keywords = []
+    for token in tokenize(question):
+        if token not in STOPWORDS and len(token) > 2 and token not in keywords:
+            keywords.append(token)
+    return keywords[:MAX_FALLBACK_KEYWORDS]
+
+
+def parse_questions(text: str) -> List[Dict]:
+    """
+    Parse generated questions grouped under technology headings.
+
+    Args:
+        text: Model output in the format requested by the generation prompt
+
+    Returns:
+        List of dicts with 'technology', 'question' and 'keywords'
+    """
+    questions = []
+    technology = ''
+
+    for line in text.splitlines():
+        heading = HEADING_PATTERN.match(line)
+        if heading:
+            technology = heading.group(1).strip()
+            continue
+
+        keywords = KEYWORDS_PATTERN.match(line)
+        if keywords and questions:
+            questions[-1]['keywords'] = [k.strip() for k in keywords.group(1).split(',') if k.strip()]
+            continue
+
+        question = QUESTION_PATTERN.match(line)
+        if question:
+            questions.append({'technology': technology, 'question': question.group(2), 'keywords': []})
+
+    for question in questions:
+        if not question['keywords']:
+            question['keywords'] = _fallback_keywords(question['question'])
+
+    return questions
+
+
+def strip_keyword_lines(text: str) -> str:
+    """
+    Remove expected-concept keyword lines before questions are shown to the candidate.
+
+    Args:
+        text: Model output
+
+    Returns:
+        Text without keyword lines
+    """
+    return '\n'.join(line for line in text.splitlines() if not KEYWORDS_PATTERN.match(line))
+
+
+class KeywordScorer:
+    """
+    Scores answers by the fraction of their question's expected concepts they mention.
+    """
+
+    def __init__(self, keyword_sets: Sequence[Sequence[str]]):
+        """
+        Build the vocabulary and the sparse question-keyword index.
+
+        Args:
+            keyword_sets: Expected-concept keywords per question
+        """
+        self.vocabulary: Dict[str, int] = {}
+        self.question_terms: List[List[str]] = []
+        pairs = []
+
+        for question_index, keywords in enumerate(keyword_sets):
+            terms = []
+            for keyword in keywords:
+                term = keyword_term(keyword)
+                if term and term not in terms:
+                    terms.append(term)
+                    pairs.append((question_index, self.vocabulary.setdefault(term, len(self.vocabulary))))
+            self.question_terms.append(terms)
+
+        self._lengths_by_first_token: Dict[str, List[int]] = {}
+        for term in self.vocabulary:
+            tokens = term.split(' ')
+            lengths = self._lengths_by_first_token.setdefault(tokens[0], [])
+            if len(tokens) not in lengths:
+                lengths.append(len(tokens))
+
+        self._width = max(len(self.vocabulary), 1)
+        self._keys = np.unique(np.array([q * self._width + t for q, t in pairs], dtype=np.int64))
+        self._totals = np.array([len(terms) for terms in self.question_terms], dtype=np.float64)
+
+    def score(self, question_indexes: Sequence[int], answers: Sequence[str]) -> np.ndarray:
+        """
+        Score a batch of answers.
+
+        Args:
+            question_indexes: Index of the question each answer responds to
+            answers: Answer texts
+
+        Returns:
+            Array of scores between 0 and 1, one per answer
+        """
+        rows = []
+        cols = []
+        for row, answer in enumerate(answers):
+            term_ids = set()
+            tokens = tokenize(answer)
+            for i, token in enumerate(tokens):
+                for length in self._lengths_by_first_token.get(token, ()):
+                    term_id = self.vocabulary.get(' '.join(tokens[i:i + length]))
+                    if term_id is not None:
+                        term_ids.add(term_id)
+            rows.extend([row] * len(term_ids))
+            cols.extend(term_ids)
+
+        questions = np.asarray(question_indexes, dtype=np.int64)
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+
+        hits = np.isin(questions[rows] * self._width + cols, self._keys)
+        matched = np.bincount(rows[hits], minlength=len(answers)).astype(np.float64)
+        totals = self._totals[questions]
+        return np.divide(matched, totals, out=np.zeros(len(answers)), where=totals > 0)
+
+    def matched_keywords(self, question_index: int, answer: str) -> List[str]:
+        """
+        List the expected concepts an answer mentions.
+
+        Args:
+            question_index: Index of the question
+            answer: Answer text
+
+        Returns:
+            Matched keyword terms in question order
+        """
+        terms = answer_terms(answer)
+        return [term for term in self.question_terms[question_index] if term in terms]
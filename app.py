@@ -5,31 +5,231 @@ Main application file for the AI-powered hiring chatbot interface.
 Run with: streamlit run app.py
 """
 
+import hmac
 import os
 import streamlit as st
 from dotenv import load_dotenv
 
-from chatbot import HiringAssistant
+from analytics import CandidateAnalytics
+from backends import RecordingBackend, ReplayBackend
+from batching import MicroBatcher, DEFAULT_BATCH_WINDOW, DEFAULT_MAX_BATCH_SIZE
+from chatbot import HiringAssistant, QUESTION_CACHE
+from conversation_flow import DEFAULT_FLOW, load_flow
+from history import ChatHistory
+from latency_slo import SLOController
+from profiling import SessionProfiler, profiler_from_env, DEFAULT_PROFILE_DIR
+from question_cache import SimilarityQuestionCache
+from returning_candidates import ReturningCandidateIndex, DEFAULT_MAX_ENTRIES
+from warmup import warm_up, read_stacks, DEFAULT_TOP_N
 
 load_dotenv()
 
 
+@st.cache_resource
+def get_question_batcher(_model):
+    """
+    Create the process-wide question micro-batcher shared by all sessions.
+    Enabled by setting QUESTION_BATCHING=1; window and size are tunable via
+    QUESTION_BATCH_WINDOW_MS and QUESTION_BATCH_SIZE.
+
+    Args:
+        _model: Backend model used for combined calls (not hashed by Streamlit)
+
+    Returns:
+        MicroBatcher instance, or None if batching is disabled
+    """
+    if os.getenv('QUESTION_BATCHING') != '1':
+        return None
+
+    window_ms = float(os.getenv('QUESTION_BATCH_WINDOW_MS', DEFAULT_BATCH_WINDOW * 1000))
+    batch_size = int(os.getenv('QUESTION_BATCH_SIZE', DEFAULT_MAX_BATCH_SIZE))
+    return MicroBatcher(_model, window=window_ms / 1000, max_batch_size=batch_size)
+
+
+@st.cache_resource
+def get_replay_backend(path: str):
+    """
+    Load a recorded cassette once per process for offline replay.
+    Replay speed is scaled by LLM_CASSETTE_TIME_SCALE (default 1.0).
+    Replay is strict: a prompt that was never recorded fails like a backend
+    error instead of being served another candidate's questions. Lenient
+    replay is left to simulate_candidates.py and the benchmarks.
+
+    Args:
+        path: Cassette file
+
+    Returns:
+        ReplayBackend instance
+    """
+    time_scale = float(os.getenv('LLM_CASSETTE_TIME_SCALE', '1.0'))
+    return ReplayBackend(path, time_scale=time_scale, strict=True)
+
+
+@st.cache_resource
+def get_latency_controller():
+    """
+    Create the process-wide latency controller shared by all sessions.
+    Enabled by setting GENERATION_SLO_SECONDS to the question generation latency target.
+
+    Returns:
+        SLOController instance, or None if no target is configured
+    """
+    target = os.getenv('GENERATION_SLO_SECONDS')
+    if not target:
+        return None
+    return SLOController(float(target))
+
+
+@st.cache_resource
+def get_screening_flow():
+    """
+    Compile the screening flow once per process.
+    A role-specific flow is loaded from the JSON file named by SCREENING_FLOW.
+
+    Returns:
+        Compiled ConversationFlow
+    """
+    flow_path = os.getenv('SCREENING_FLOW')
+    if flow_path:
+        return load_flow(flow_path)
+    return DEFAULT_FLOW
+
+
+@st.cache_resource
+def get_question_cache():
+    """
+    Create the process-wide question cache shared by all sessions.
+    Setting QUESTION_CACHE_MODE=similarity serves overlapping tech stacks from
+    cached per-technology question blocks.
+
+    Returns:
+        Question cache instance
+    """
+    if os.getenv('QUESTION_CACHE_MODE') == 'similarity':
+        return SimilarityQuestionCache()
+    return QUESTION_CACHE
+
+
+@st.cache_resource
+def get_returning_candidates():
+    """
+    Create the process-wide, in-memory index of recently completed screenings.
+    Enabled by setting RETURNING_CANDIDATE_TTL_SECONDS; the number of candidates
+    kept is bounded by RETURNING_CANDIDATE_MAX_ENTRIES.
+
+    Returns:
+        ReturningCandidateIndex instance, or None if disabled
+    """
+    ttl = os.getenv('RETURNING_CANDIDATE_TTL_SECONDS')
+    if not ttl:
+        return None
+    max_entries = int(os.getenv('RETURNING_CANDIDATE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES))
+    return ReturningCandidateIndex(float(ttl), max_entries)
+
+
+@st.cache_resource
+def get_analytics():
+    """
+    Create the process-wide, in-memory analytics store of completed screenings.
+    Enabled by setting ANALYTICS_RETENTION_HOURS; rows older than that expire.
+    The recruiter view also requires ANALYTICS_ACCESS_KEY (see analytics_access_granted).
+
+    Returns:
+        CandidateAnalytics instance, or None if disabled
+    """
+    hours = os.getenv('ANALYTICS_RETENTION_HOURS')
+    if not hours:
+        return None
+    return CandidateAnalytics(float(hours) * 3600)
+
+
+def analytics_access_granted() -> bool:
+    """
+    Check whether the request may see recruiter analytics. The view is only
+    served when ANALYTICS_ACCESS_KEY is set and the page is opened with a
+    matching ?key= query parameter.
+
+    Returns:
+        True if the access key is configured and matches
+    """
+    expected = os.getenv('ANALYTICS_ACCESS_KEY')
+    if not expected:
+        return False
+    provided = st.query_params.get('key', '')
+    return hmac.compare_digest(provided.encode('utf-8'), expected.encode('utf-8'))
+
+
+def answer_collection_enabled() -> bool:
+    """
+    Check whether sessions stay open to collect and score answers to the
+    generated questions. Enabled by setting ANSWER_COLLECTION=1.
+
+    Returns:
+        True if answer collection is enabled
+    """
+    return os.getenv('ANSWER_COLLECTION') == '1'
+
+
+@st.cache_resource
+def get_warm_up():
+    """
+    Warm up the backend client, validators, indexes and question cache once per process.
+    Questions for the WARMUP_TOP_N most common stacks in the WARMUP_STACKS file
+    are pre-generated when that file is configured.
+
+    Returns:
+        WarmUpReport whose model is shared by all sessions (None without an API key)
+    """
+    replay_path = os.getenv('LLM_CASSETTE_REPLAY')
+    record_path = os.getenv('LLM_CASSETTE_RECORD')
+    stacks_path = os.getenv('WARMUP_STACKS')
+
+    report = warm_up(
+        os.getenv('GEMINI_API_KEY'),
+        model=get_replay_backend(replay_path) if replay_path else None,
+        stacks=read_stacks(stacks_path) if stacks_path else None,
+        top_n=int(os.getenv('WARMUP_TOP_N', DEFAULT_TOP_N)),
+        flow_path=os.getenv('SCREENING_FLOW'),
+        latency_controller=get_latency_controller(),
+        collect_answers=answer_collection_enabled(),
+        question_cache=get_question_cache()
+    )
+
+    if record_path and not replay_path and report.model is not None:
+        report.model = RecordingBackend(report.model, record_path)
+
+    print(f"Warm-up finished in {report.total_seconds:.2f}s: " +
+          ", ".join(f"{step['step']} {step['seconds'] * 1000:.0f}ms" for step in report.steps))
+    return report
+
+
 def initialize_session_state():
     """
     Initialize Streamlit session state variables.
     All data is stored in-memory only for GDPR compliance.
     """
     if 'messages' not in st.session_state:
-        st.session_state.messages = []
+        st.session_state.messages = ChatHistory()
+
+    if 'profiler' not in st.session_state:
+        st.session_state.profiler = profiler_from_env()
 
     if 'chatbot' not in st.session_state:
-        api_key = os.getenv('GEMINI_API_KEY')
+        warm = get_warm_up()
 
-        if not api_key:
+        if warm.model is None:
             st.error("GEMINI_API_KEY not found. Please set it in your .env file.")
             st.stop()
 
-        st.session_state.chatbot = HiringAssistant(api_key)
+        st.session_state.chatbot = HiringAssistant(
+            os.getenv('GEMINI_API_KEY') or '', model=warm.model, flow=get_screening_flow())
+        st.session_state.chatbot.question_batcher = get_question_batcher(st.session_state.chatbot.model)
+        st.session_state.chatbot.latency_controller = get_latency_controller()
+        st.session_state.chatbot.profiler = st.session_state.profiler
+        st.session_state.chatbot.collect_answers = answer_collection_enabled()
+        st.session_state.chatbot.question_cache = get_question_cache()
+        st.session_state.chatbot.returning_candidates = get_returning_candidates()
+        st.session_state.chatbot.analytics = get_analytics()
 
     if 'conversation_active' not in st.session_state:
         st.session_state.conversation_active = True
@@ -48,8 +248,19 @@ def initialize_session_state():
 def render_chat_interface():
     """
     Render the chat interface with message history.
+    Earlier messages are only inflated from the compressed archive when requested.
     """
-    for message in st.session_state.messages:
+    history = st.session_state.messages
+
+    if history.earlier_count:
+        if st.toggle(f"Show earlier messages ({history.earlier_count})", key="show_earlier"):
+            if history.dropped_count:
+                st.caption(f"{history.dropped_count} older messages were discarded to limit memory use.")
+            for message in history.earlier_messages():
+                with st.chat_message(message["role"]):
+                    st.markdown(message["content"])
+
+    for message in history:
         with st.chat_message(message["role"]):
             st.markdown(message["content"])
 
@@ -106,8 +317,38 @@ def render_sidebar():
         Your information is GDPR-compliant and secure.
         """)
 
+        returning = st.session_state.chatbot.returning_candidates
+        if returning is not None:
+            st.caption(f"Completed screenings are kept in memory for {returning.ttl_seconds / 60:.0f} minutes "
+                       "so you can resume after a reset.")
+
         st.divider()
 
+        if os.getenv('PROFILING_ALLOW_TOGGLE') == '1':
+            profiling_on = st.toggle("Profile this session", value=st.session_state.profiler is not None)
+            if profiling_on and st.session_state.profiler is None:
+                st.session_state.profiler = SessionProfiler(os.getenv('PROFILING_DIR', DEFAULT_PROFILE_DIR))
+            elif not profiling_on:
+                st.session_state.profiler = None
+            st.session_state.chatbot.profiler = st.session_state.profiler
+
+            if st.session_state.profiler is not None:
+                st.caption(f"{len(st.session_state.profiler.captures)} profiles written to "
+                           f"{st.session_state.profiler.output_dir}/")
+
+            st.divider()
+
+        # Scores and expected keywords are for recruiters only; the candidate
+        # gets a copy of their own answers.
+        if st.session_state.chatbot.answers:
+            st.download_button("Download my answers (JSON)",
+                               st.session_state.chatbot.export_answers('json', include_scores=False),
+                               file_name="screening_answers.json", mime="application/json")
+            st.download_button("Download my answers (CSV)",
+                               st.session_state.chatbot.export_answers('csv', include_scores=False),
+                               file_name="screening_answers.csv", mime="text/csv")
+            st.divider()
+
         if st.button("Reset Conversation", type="secondary"):
             for key in list(st.session_state.keys()):
                 del st.session_state[key]
@@ -119,9 +360,39 @@ def render_sidebar():
         st.caption("Built with Streamlit")
 
 
+def render_analytics(store: CandidateAnalytics):
+    """
+    Render live aggregates over recent screenings for recruiters.
+
+    Args:
+        store: Analytics store shared by all sessions
+    """
+    st.title("🎯 TalentScout Screening Analytics")
+    st.caption(f"{store.count()} screenings in the last {store.retention_seconds / 3600:g} hours")
+
+    left, right = st.columns(2)
+    with left:
+        st.subheader("Top technologies")
+        st.table([{"Technology": name, "Candidates": count} for name, count in store.top_technologies(15)])
+        st.subheader("Locations")
+        st.table([{"Location": name, "Candidates": count} for name, count in store.location_counts(15)])
+    with right:
+        st.subheader("Experience")
+        st.bar_chart({label: count for label, count in store.experience_histogram()})
+        st.subheader("Experience by position")
+        st.table([
+            {"Position": position, "Candidates": summary['count'], "Median years": summary['median'],
+             "Mean years": round(summary['mean'], 1)}
+            for position, summary in store.experience_by_position().items()
+        ])
+
+
 def main():
     """
     Main application entry point.
+    Each rerun is profiled when profiling is enabled for the session.
+    With analytics enabled, ?view=analytics&key=<ANALYTICS_ACCESS_KEY> shows
+    recruiter aggregates instead of the chat.
     """
     st.set_page_config(
         page_title="TalentScout Hiring Assistant",
@@ -130,6 +401,26 @@ def main():
         initial_sidebar_state="expanded"
     )
 
+    analytics = get_analytics()
+    if analytics is not None and st.query_params.get('view') == 'analytics':
+        if not analytics_access_granted():
+            st.error("The analytics view is only available to recruiters.")
+            return
+        render_analytics(analytics)
+        return
+
+    profiler = st.session_state.get('profiler')
+    if profiler is None:
+        render_app()
+    else:
+        with profiler.capture('rerun'):
+            render_app()
+
+
+def render_app():
+    """
+    Render the page and handle the current user message.
+    """
     st.title("🎯 TalentScout Hiring Assistant")
     st.subheader("Initial Candidate Screening Chat")
 
@@ -0,0 +1,380 @@
+"""
+TalentScout Hiring Assistant - LLM Backends
+This module contains offline stand-ins for the Gemini model that expose the
+same generate_content(prompt) interface, used by the simulation harness and
+benchmarks so they run without an API key or network access.
+
+RecordingBackend captures real Gemini responses and their timing into a
+cassette file, and ReplayBackend serves them back offline. Cassettes store
+prompt hashes only, never prompt text.
+"""
+
+import gzip
+import hashlib
+import json
+import re
+import threading
+import time
+from typing import Dict, Iterator, List, Optional
+
+from prompts import BATCH_OUTPUT_MARKER
+from utils import estimate_tokens
+
+BATCH_SECTION_PATTERN = re.compile(r'^\[CANDIDATE (\d+)\] tech stack: (.*)$', re.MULTILINE)
+QUESTION_COUNT_PATTERN = re.compile(r'EXACTLY (\d+) questions per technology')
+KEYWORDS_REQUEST_MARKER = 'Keywords: ['
+
+DEFAULT_STUB_QUESTIONS = 4
+STUB_CHUNK_CHARS = 80
+
+
+class StubResponse:
+    """
+    Minimal response object mirroring the .text attribute of a Gemini response.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class StubBackend:
+    """
+    Offline backend returning canned technical questions for any prompt.
+    """
+
+    def __init__(self, latency: float = 0.0, latency_per_token: float = 0.0):
+        """
+        Initialize the stub backend.
+
+        Args:
+            latency: Seconds to sleep per call, to model network round trips
+            latency_per_token: Additional seconds per output token, to model decoding time
+        """
+        self.latency = latency
+        self.latency_per_token = latency_per_token
+        self.calls = 0
+        self.prompts: List[str] = []
+
+    def generate_content(self, prompt: str, generation_config: Optional[Dict] = None,
+                         stream: bool = False):
+        """
+        Return canned questions for the technologies named in the prompt.
+
+        Args:
+            prompt: Full prompt sent to the model
+            generation_config: Optional config; max_output_tokens truncates the output
+            stream: If True, return an iterator of chunk responses spread over the latency
+
+        Returns:
+            StubResponse with generated question text, or an iterator of chunks
+        """
+        self.calls += 1
+        self.prompts.append(prompt)
+
+        count_match = QUESTION_COUNT_PATTERN.search(prompt)
+        count = int(count_match.group(1)) if count_match else DEFAULT_STUB_QUESTIONS
+        keywords = KEYWORDS_REQUEST_MARKER in prompt
+
+        sections = BATCH_SECTION_PATTERN.findall(prompt)
+        if sections:
+            text = '\n\n'.join(
+                f"{BATCH_OUTPUT_MARKER.format(index=index)}\n{_canned_questions(_split_stack(stack), count, keywords)}"
+                for index, stack in sections
+            )
+        else:
+            text = _canned_questions(_extract_tech_stack(prompt), count, keywords)
+
+        max_tokens = (generation_config or {}).get('max_output_tokens')
+        if max_tokens:
+            text = text[:max_tokens * 4]
+
+        delay = self.latency + self.latency_per_token * estimate_tokens(text)
+
+        if stream:
+            return _stream_chunks(text, delay)
+
+        if delay:
+            time.sleep(delay)
+
+        return StubResponse(text)
+
+
+def _stream_chunks(text: str, delay: float) -> Iterator[StubResponse]:
+    """
+    Yield text in fixed-size chunks, spreading the delay evenly across them.
+
+    Args:
+        text: Full response text
+        delay: Total seconds the stream should take
+
+    Yields:
+        StubResponse per chunk
+    """
+    chunks = [text[i:i + STUB_CHUNK_CHARS] for i in range(0, len(text), STUB_CHUNK_CHARS)] or ['']
+    for chunk in chunks:
+        if delay:
+            time.sleep(delay / len(chunks))
+        yield StubResponse(chunk)
+
+
+def _extract_tech_stack(prompt: str) -> List[str]:
+    """
+    Recover the technology list from a question generation prompt.
+
+    Args:
+        prompt: Full prompt sent to the model
+
+    Returns:
+        List of technology names, empty if none were found
+    """
+    marker = 'tech stack: '
+    start = prompt.find(marker)
+    if start == -1:
+        return []
+
+    return _split_stack(prompt[start + len(marker):].split('\n', 1)[0])
+
+
+def _split_stack(line: str) -> List[str]:
+    """
+    Split a comma-separated technology list.
+
+    Args:
+        line: Comma-separated technologies
+
+    Returns:
+        List of technology names
+    """
+    return [tech.strip() for tech in line.split(',') if tech.strip()]
+
+
+STUB_QUESTION_TEMPLATES = [
+    "What are the core concepts of {tech}?",
+    "How would you structure a medium-sized project using {tech}?",
+    "How do you debug performance problems in {tech}?",
+    "Describe a production issue you solved with {tech}.",
+    "How do you test code that uses {tech}?",
+]
+
+STUB_KEYWORD_TEMPLATES = [
+    "{tech}, architecture, use cases, trade-offs",
+    "modules, separation of concerns, configuration, dependencies",
+    "profiling, bottleneck, caching, benchmarks",
+    "root cause, monitoring, rollback, postmortem",
+    "unit tests, mocking, integration tests, coverage",
+]
+
+
+def _canned_questions(technologies: List[str], count: int = DEFAULT_STUB_QUESTIONS,
+                      keywords: bool = False) -> str:
+    """
+    Build question text in the format requested by the generation prompt.
+
+    Args:
+        technologies: Technology names to generate questions for
+        count: Number of questions per technology
+        keywords: Add an expected-concept keyword line below each question
+
+    Returns:
+        Formatted questions grouped by technology
+    """
+    blocks = []
+    for tech in technologies:
+        questions = []
+        for i in range(1, count + 1):
+            template = (i - 1) % len(STUB_QUESTION_TEMPLATES)
+            questions.append(f"{i}. {STUB_QUESTION_TEMPLATES[template].format(tech=tech)}")
+            if keywords:
+                questions.append(f"   Keywords: {STUB_KEYWORD_TEMPLATES[template].format(tech=tech)}")
+        blocks.append(f"**{tech}**\n" + '\n'.join(questions))
+    return '\n\n'.join(blocks)
+
+
+class CassetteMissError(KeyError):
+    """
+    Raised by a strict ReplayBackend when a prompt was never recorded.
+    """
+
+
+def prompt_hash(prompt: str, generation_config: Optional[Dict] = None) -> str:
+    """
+    Hash a prompt and its generation config into a cassette key.
+
+    Args:
+        prompt: Full prompt sent to the model
+        generation_config: Optional generation config
+
+    Returns:
+        Hex digest identifying the request
+    """
+    config = json.dumps(generation_config or {}, sort_keys=True)
+    return hashlib.sha256(f"{prompt}\x00{config}".encode('utf-8')).hexdigest()[:24]
+
+
+class RecordingBackend:
+    """
+    Wraps a model and appends every call to a gzip-compressed JSON-lines cassette.
+
+    Each entry holds the prompt hash, the chunk texts with their arrival offsets
+    (seconds since the request started) and the total latency. Responses are
+    requested as a stream so chunk timing is captured, then joined for the caller.
+    """
+
+    def __init__(self, model, path: str, stream: bool = True):
+        """
+        Initialize the recorder.
+
+        Args:
+            model: Object exposing generate_content(prompt, ...)
+            path: Cassette file; entries are appended
+            stream: Request streamed responses to capture chunk timing
+        """
+        self.model = model
+        self.path = path
+        self.stream = stream
+        self.recorded = 0
+        self._lock = threading.Lock()
+
+    def generate_content(self, prompt: str, generation_config: Optional[Dict] = None) -> StubResponse:
+        """
+        Forward a request to the wrapped model and record the response.
+
+        Args:
+            prompt: Full prompt sent to the model
+            generation_config: Optional generation config
+
+        Returns:
+            StubResponse with the full response text
+        """
+        kwargs = {'generation_config': generation_config} if generation_config else {}
+        start = time.perf_counter()
+        chunks = []
+
+        if self.stream:
+            for chunk in self.model.generate_content(prompt, stream=True, **kwargs):
+                chunks.append([round(time.perf_counter() - start, 6), chunk.text])
+        else:
+            text = self.model.generate_content(prompt, **kwargs).text
+            chunks.append([round(time.perf_counter() - start, 6), text])
+
+        entry = {
+            'hash': prompt_hash(prompt, generation_config),
+            'latency': round(time.perf_counter() - start, 6),
+            'chunks': chunks,
+        }
+        with self._lock:
+            with gzip.open(self.path, 'at', encoding='utf-8') as f:
+                f.write(json.dumps(entry, separators=(',', ':')) + '\n')
+            self.recorded += 1
+
+        return StubResponse(''.join(text for _, text in chunks))
+
+
+def load_cassette(path: str) -> List[Dict]:
+    """
+    Read every entry of a cassette file.
+
+    Args:
+        path: Cassette file
+
+    Returns:
+        List of recorded entries in recording order
+    """
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class ReplayBackend:
+    """
+    Serves recorded responses offline with the recorded chunk timing.
+
+    Requests are matched by prompt hash; repeated prompts cycle through their
+    recordings. A strict backend raises CassetteMissError for unknown prompts,
+    otherwise recordings are served round-robin so the latency and size
+    distribution of the cassette is preserved for new prompts.
+    """
+
+    def __init__(self, path: str, time_scale: float = 1.0, strict: bool = True):
+        """
+        Load a cassette.
+
+        Args:
+            path: Cassette file
+            time_scale: Multiplier for recorded delays (0 replays instantly)
+            strict: Raise on prompts that were never recorded
+        """
+        self.entries = load_cassette(path)
+        self.time_scale = time_scale
+        self.strict = strict
+        self.calls = 0
+        self.misses = 0
+
+        self._by_hash: Dict[str, List[Dict]] = {}
+        for entry in self.entries:
+            self._by_hash.setdefault(entry['hash'], []).append(entry)
+        self._positions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _next_entry(self, key: str) -> Dict:
+        """
+        Pick the recording to serve for a key.
+
+        Args:
+            key: Prompt hash
+
+        Returns:
+            Cassette entry
+
+        Raises:
+            CassetteMissError: If strict and the key was never recorded
+        """
+        with self._lock:
+            self.calls += 1
+            candidates = self._by_hash.get(key)
+            if candidates is None:
+                self.misses += 1
+                if self.strict or not self.entries:
+                    raise CassetteMissError(key)
+                candidates, key = self.entries, ''
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            return candidates[position % len(candidates)]
+
+    def generate_content(self, prompt: str, generation_config: Optional[Dict] = None,
+                         stream: bool = False):
+        """
+        Replay the recorded response for a prompt.
+
+        Args:
+            prompt: Full prompt sent to the model
+            generation_config: Optional generation config
+            stream: If True, return an iterator yielding chunks at their recorded offsets
+
+        Returns:
+            StubResponse with the full text, or an iterator of chunks
+        """
+        entry = self._next_entry(prompt_hash(prompt, generation_config))
+
+        if stream:
+            return self._replay_chunks(entry)
+
+        if self.time_scale:
+            time.sleep(entry['latency'] * self.time_scale)
+        return StubResponse(''.join(text for _, text in entry['chunks']))
+
+    def _replay_chunks(self, entry: Dict) -> Iterator[StubResponse]:
+        """
+        Yield recorded chunks, sleeping until each recorded offset.
+
+        Args:
+            entry: Cassette entry
+
+        Yields:
+            StubResponse per chunk
+        """
+        start = time.perf_counter()
+        for offset, text in entry['chunks']:
+            remaining = offset * self.time_scale - (time.perf_counter() - start)
+            if remaining > 0:
+                time.sleep(remaining)
+            yield StubResponse(text)
@@ -0,0 +1,257 @@
+"""
+TalentScout Hiring Assistant - Micro-Batching
+This module combines question generation requests that arrive within a short
+window into a single LLM call, trading a few milliseconds of queueing for
+fewer round trips against the backend's requests-per-minute quota.
+"""
+
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from prompts import (
+    SYSTEM_PROMPT,
+    TECHNICAL_QUESTION_GENERATION_PROMPT,
+    ANSWER_KEYWORDS_INSTRUCTION,
+    BATCHED_QUESTION_GENERATION_PROMPT,
+    BATCH_SECTION_TEMPLATE,
+    BATCH_OUTPUT_MARKER,
+    DEFAULT_QUESTIONS_PER_TECHNOLOGY
+)
+
+DEFAULT_BATCH_WINDOW = 0.05
+DEFAULT_MAX_BATCH_SIZE = 8
+
+_MARKER_PREFIX, _MARKER_SUFFIX = BATCH_OUTPUT_MARKER.split('{index}')
+BATCH_OUTPUT_PATTERN = re.compile(
+    r'^\s*' + re.escape(_MARKER_PREFIX) + r'(\d+)' + re.escape(_MARKER_SUFFIX) + r'\s*$', re.MULTILINE)
+
+
+class _Request:
+    """
+    A queued generation request waiting for its share of a batch response.
+    """
+
+    def __init__(self, tech_stack: str):
+        self.tech_stack = tech_stack
+        self.enqueued_at = time.monotonic()
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def build_question_prompt(tech_stack: str,
+                          questions_per_technology=DEFAULT_QUESTIONS_PER_TECHNOLOGY,
+                          with_keywords: bool = False) -> str:
+    """
+    Build the single-candidate question generation prompt.
+
+    Args:
+        tech_stack: Comma-separated technologies
+        questions_per_technology: Number or range of questions asked per technology
+        with_keywords: Also ask for expected-concept keywords below each question
+
+    Returns:
+        Full prompt including the system prompt
+    """
+    prompt = TECHNICAL_QUESTION_GENERATION_PROMPT.format(
+        tech_stack=tech_stack, questions_per_technology=questions_per_technology)
+    if with_keywords:
+        prompt += ANSWER_KEYWORDS_INSTRUCTION
+    return f"{SYSTEM_PROMPT}\n\n{prompt}"
+
+
+def build_batched_prompt(tech_stacks: List[str]) -> str:
+    """
+    Build one prompt covering several candidates, each in a delimited section.
+
+    Args:
+        tech_stacks: Comma-separated technologies per candidate, in batch order
+
+    Returns:
+        Full prompt including the system prompt
+    """
+    sections = '\n'.join(
+        BATCH_SECTION_TEMPLATE.format(index=index, tech_stack=tech_stack)
+        for index, tech_stack in enumerate(tech_stacks, 1)
+    )
+    instructions = TECHNICAL_QUESTION_GENERATION_PROMPT.format(
+        tech_stack="(the candidate's tech stack)",
+        questions_per_technology=DEFAULT_QUESTIONS_PER_TECHNOLOGY)
+    prompt = BATCHED_QUESTION_GENERATION_PROMPT.format(instructions=instructions, sections=sections)
+    return f"{SYSTEM_PROMPT}\n\n{prompt}"
+
+
+def split_batched_response(text: str, expected: int) -> Optional[List[str]]:
+    """
+    Split a batched response back into per-candidate question blocks.
+
+    Args:
+        text: Raw model output
+        expected: Number of candidates in the batch
+
+    Returns:
+        List of question blocks in batch order, or None if any section is missing or empty
+    """
+    parts = BATCH_OUTPUT_PATTERN.split(text)
+    sections: Dict[int, str] = {}
+    for marker, body in zip(parts[1::2], parts[2::2]):
+        sections[int(marker)] = body.strip()
+
+    blocks = [sections.get(index, '') for index in range(1, expected + 1)]
+    if not all(blocks):
+        return None
+    return blocks
+
+
+class MicroBatcher:
+    """
+    Collects generation requests for up to `window` seconds or `max_batch_size`
+    requests, sends them as one combined prompt and hands each caller its section.
+    Falls back to one call per request when the combined response cannot be parsed.
+    """
+
+    def __init__(self, model, window: float = DEFAULT_BATCH_WINDOW,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE):
+        """
+        Initialize the micro-batcher.
+
+        Args:
+            model: Object exposing generate_content(prompt)
+            window: Seconds to wait for more requests after the first one arrives
+            max_batch_size: Maximum number of requests combined into one call
+        """
+        self.model = model
+        self.window = window
+        self.max_batch_size = max_batch_size
+
+        self._cond = threading.Condition()
+        self._queue: List[_Request] = []
+        self._worker = None
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='question-batch')
+
+        self._stats_lock = threading.Lock()
+        self._batch_sizes = Counter()
+        self.fallbacks = 0
+
+    def generate(self, tech_stack: str) -> str:
+        """
+        Generate questions for one candidate, possibly as part of a batch.
+
+        Args:
+            tech_stack: Comma-separated technologies
+
+        Returns:
+            Generated question text for this candidate
+
+        Raises:
+            Any exception raised by the backend call serving this request
+        """
+        request = _Request(tech_stack)
+
+        with self._cond:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._collect_batches, daemon=True)
+                self._worker.start()
+            self._queue.append(request)
+            self._cond.notify_all()
+
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _collect_batches(self):
+        """
+        Worker loop: cut a batch when it is full or its window has elapsed.
+        """
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+
+                deadline = self._queue[0].enqueued_at + self.window
+                while len(self._queue) < self.max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                batch = self._queue[:self.max_batch_size]
+                del self._queue[:self.max_batch_size]
+
+            self._executor.submit(self._run_batch, batch)
+
+    def _run_batch(self, batch: List[_Request]):
+        """
+        Serve a batch with one combined call, or individually if that fails to parse.
+
+        Args:
+            batch: Requests cut by the worker loop
+        """
+        with self._stats_lock:
+            self._batch_sizes[len(batch)] += 1
+
+        if len(batch) == 1:
+            self._run_single(batch[0])
+            return
+
+        try:
+            text = self.model.generate_content(build_batched_prompt([r.tech_stack for r in batch])).text
+        except Exception as e:
+            for request in batch:
+                request.error = e
+                request.done.set()
+            return
+
+        blocks = split_batched_response(text, len(batch))
+        if blocks is None:
+            with self._stats_lock:
+                self.fallbacks += 1
+            for request in batch:
+                self._run_single(request)
+            return
+
+        for request, block in zip(batch, blocks):
+            request.result = block
+            request.done.set()
+
+    def _run_single(self, request: _Request):
+        """
+        Serve one request with its own backend call.
+
+        Args:
+            request: Request to serve
+        """
+        try:
+            request.result = self.model.generate_content(build_question_prompt(request.tech_stack)).text
+        except Exception as e:
+            request.error = e
+        finally:
+            request.done.set()
+
+    def stats(self) -> Dict:
+        """
+        Get achieved batch sizes.
+
+        Returns:
+            Dictionary with batch count, request count, average and maximum batch
+            size, parse fallbacks and a histogram of batch sizes
+        """
+        with self._stats_lock:
+            histogram = dict(self._batch_sizes)
+            fallbacks = self.fallbacks
+
+        batches = sum(histogram.values())
+        requests = sum(size * count for size, count in histogram.items())
+        return {
+            'batches': batches,
+            'requests': requests,
+            'average_batch_size': requests / batches if batches else 0.0,
+            'max_batch_size': max(histogram) if histogram else 0,
+            'fallbacks': fallbacks,
+            'histogram': histogram,
+        }
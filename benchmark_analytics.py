@@ -0,0 +1,112 @@
+"""
+TalentScout - Screening Analytics Benchmark
+Loads synthetic screenings into the columnar analytics store and times each
+aggregate query.
+
+Run with: python benchmark_analytics.py [rows]
+"""
+
+import random
+import sys
+import time
+
+from analytics import CandidateAnalytics
+
+DEFAULT_ROWS = 1_000_000
+LOAD_BATCH = 50_000
+QUERY_REPEATS = 5
+SEED = 3
+
+POSITIONS = ['Backend Engineer', 'Frontend Engineer', 'Full Stack Developer', 'Data Scientist',
+             'DevOps Engineer', 'Mobile Developer', 'QA Engineer', 'Engineering Manager']
+LOCATIONS = ['Berlin', 'London', 'Paris', 'Remote', 'New York', 'Bangalore', 'Toronto',
+             'Amsterdam', 'Madrid', 'Warsaw', 'Lisbon', 'Singapore']
+TECHNOLOGIES = ['Python', 'Django', 'JavaScript', 'React', 'TypeScript', 'Java', 'Spring', 'Go',
+                'Docker', 'Kubernetes', 'AWS', 'PostgreSQL', 'Redis', 'Kafka', 'SQL', 'Node.js',
+                'Rust', 'C#', '.NET', 'Swift', 'Kotlin', 'Terraform', 'Pandas', 'Spark']
+
+
+def synthetic_records(count: int, rng: random.Random) -> list:
+    """
+    Generate candidate records shaped like collected candidate data.
+
+    Args:
+        count: Number of records
+        rng: Random generator
+
+    Returns:
+        List of candidate data dictionaries
+    """
+    return [
+        {
+            'experience': f"{rng.choice([0.5, 1, 2, 3, 4, 5, 7, 10, 15])} years",
+            'position': rng.choice(POSITIONS),
+            'location': rng.choice(LOCATIONS),
+            'tech_stack': rng.sample(TECHNOLOGIES, rng.randint(2, 6)),
+        }
+        for _ in range(count)
+    ]
+
+
+def time_query(fn) -> float:
+    """
+    Time the fastest of several runs of a query.
+
+    Args:
+        fn: Zero-argument query
+
+    Returns:
+        Best run time in seconds
+    """
+    best = float('inf')
+    for _ in range(QUERY_REPEATS):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(rows: int = DEFAULT_ROWS) -> dict:
+    """
+    Load rows and time every aggregate query.
+
+    Args:
+        rows: Number of screenings to load
+
+    Returns:
+        Dictionary with load time, per-query times and store stats
+    """
+    rng = random.Random(SEED)
+    store = CandidateAnalytics()
+    records = synthetic_records(LOAD_BATCH, rng)
+
+    start = time.perf_counter()
+    for offset in range(0, rows, LOAD_BATCH):
+        store.add_many(records[:min(LOAD_BATCH, rows - offset)])
+    load_seconds = time.perf_counter() - start
+
+    queries = {
+        'count': store.count,
+        'top_technologies': lambda: store.top_technologies(10),
+        'location_counts': store.location_counts,
+        'experience_histogram': store.experience_histogram,
+        'experience_by_position': store.experience_by_position,
+    }
+    return {
+        'rows': store.count(),
+        'load_seconds': load_seconds,
+        'queries': {name: time_query(fn) for name, fn in queries.items()},
+        'stats': store.stats(),
+    }
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("TalentScout - Screening Analytics Benchmark")
+    print("=" * 70)
+
+    results = run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS)
+    print(f"Loaded {results['rows']:,} screenings in {results['load_seconds']:.1f} s "
+          f"({results['stats']['memory_bytes'] / 2 ** 20:.1f} MiB)\n")
+    for name, seconds in results['queries'].items():
+        print(f"{name:<24} {seconds * 1000:>8.2f} ms")
@@ -0,0 +1,84 @@
+"""
+TalentScout - Answer Scoring Benchmark
+Measures local keyword scoring throughput for batches of candidate answers.
+
+Run with: python benchmark_answer_scoring.py
+"""
+
+import random
+import time
+
+from answer_scoring import KeywordScorer, parse_questions
+from backends import StubBackend
+from batching import build_question_prompt
+
+ANSWER_COUNT = 10000
+ANSWER_WORDS = 60
+SEED = 7
+
+TECHNOLOGIES = 'Python, Django, PostgreSQL, Redis, Docker, Kubernetes, AWS, React'
+
+FILLER_WORDS = ['we', 'the', 'service', 'team', 'used', 'data', 'request', 'because', 'then',
+                'system', 'user', 'code', 'when', 'it', 'was', 'a', 'production', 'change']
+
+
+def build_answers(questions: list, count: int, rng: random.Random) -> tuple:
+    """
+    Build synthetic answers mixing filler words with some expected keywords.
+
+    Args:
+        questions: Parsed questions with keywords
+        count: Number of answers
+        rng: Random generator
+
+    Returns:
+        Tuple of (question indexes, answer texts)
+    """
+    indexes = []
+    answers = []
+    for _ in range(count):
+        index = rng.randrange(len(questions))
+        words = [rng.choice(FILLER_WORDS) for _ in range(ANSWER_WORDS)]
+        for keyword in questions[index]['keywords']:
+            if rng.random() < 0.5:
+                words.insert(rng.randrange(len(words)), keyword)
+        indexes.append(index)
+        answers.append(' '.join(words))
+    return indexes, answers
+
+
+def run_benchmark() -> dict:
+    """
+    Score a batch of answers and measure throughput.
+
+    Returns:
+        Dictionary with answer count, elapsed time, throughput and mean score
+    """
+    text = StubBackend().generate_content(build_question_prompt(TECHNOLOGIES, 4, with_keywords=True)).text
+    questions = parse_questions(text)
+    scorer = KeywordScorer([question['keywords'] for question in questions])
+    indexes, answers = build_answers(questions, ANSWER_COUNT, random.Random(SEED))
+
+    start = time.perf_counter()
+    scores = scorer.score(indexes, answers)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'questions': len(questions),
+        'answers': len(answers),
+        'seconds': elapsed,
+        'answers_per_second': len(answers) / elapsed,
+        'mean_score': float(scores.mean()),
+    }
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("TalentScout - Answer Scoring Benchmark")
+    print("=" * 70)
+
+    results = run_benchmark()
+    print(f"Scored {results['answers']} answers to {results['questions']} questions "
+          f"in {results['seconds'] * 1000:.1f} ms")
+    print(f"Throughput: {results['answers_per_second']:,.0f} answers/s")
+    print(f"Mean score: {results['mean_score']:.2f}")
@@ -0,0 +1,101 @@
+"""
+TalentScout - Latency SLO Benchmark
+Compares question generation latency by stack size with and without the
+adaptive latency controller, using a stub backend with per-token latency.
+
+Run with: python benchmark_latency_slo.py
+"""
+
+import time
+
+from backends import StubBackend
+from chatbot import HiringAssistant
+from coalescing import SingleFlight
+from latency_slo import SLOController, LatencyModel
+from question_cache import QuestionCache
+
+BACKEND_OVERHEAD = 0.05
+BACKEND_SECONDS_PER_TOKEN = 0.0005
+TARGET_SECONDS = 0.25
+WARMUP_REQUESTS = 5
+
+TECHNOLOGIES = ['Python', 'Django', 'PostgreSQL', 'Redis', 'Docker',
+                'Kubernetes', 'AWS', 'React', 'TypeScript', 'Kafka']
+
+
+def time_generation(backend: StubBackend, technologies: list, controller=None) -> float:
+    """
+    Time question generation for one candidate.
+
+    Args:
+        backend: Stub backend
+        technologies: Candidate tech stack
+        controller: Optional SLOController
+
+    Returns:
+        Generation latency in seconds
+    """
+    assistant = HiringAssistant(api_key='', model=backend)
+    assistant.question_flights = SingleFlight()
+    assistant.question_cache = QuestionCache()
+    assistant.latency_controller = controller
+    assistant.candidate_data = {'tech_stack': technologies}
+    assistant.current_field_index = len(assistant.flow)
+
+    start = time.perf_counter()
+    assistant.process_user_response("ok")
+    return time.perf_counter() - start
+
+
+def run_benchmark() -> dict:
+    """
+    Measure latency per stack size with the controller off and on.
+
+    Returns:
+        Dictionary with per-size latencies, SLO attainment and controller stats
+    """
+    backend = StubBackend(latency=BACKEND_OVERHEAD, latency_per_token=BACKEND_SECONDS_PER_TOKEN)
+    controller = SLOController(TARGET_SECONDS, LatencyModel(overhead=0.5, seconds_per_token=0.01))
+
+    for size in range(1, WARMUP_REQUESTS + 1):
+        time_generation(backend, TECHNOLOGIES[:size * 2], controller)
+
+    rows = []
+    for size in range(1, len(TECHNOLOGIES) + 1):
+        baseline = time_generation(backend, TECHNOLOGIES[:size])
+        adaptive = time_generation(backend, TECHNOLOGIES[:size], controller)
+        plan = controller.last_plan
+        rows.append({
+            'technologies': size,
+            'baseline_seconds': baseline,
+            'adaptive_seconds': adaptive,
+            'questions_per_technology': plan.questions_per_technology,
+            'covered': len(plan.technologies),
+        })
+
+    return {
+        'rows': rows,
+        'baseline_attainment': sum(r['baseline_seconds'] <= TARGET_SECONDS for r in rows) / len(rows),
+        'adaptive_attainment': sum(r['adaptive_seconds'] <= TARGET_SECONDS for r in rows) / len(rows),
+        'controller': controller.stats(),
+    }
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("TalentScout - Latency SLO Benchmark")
+    print("=" * 70)
+
+    results = run_benchmark()
+    print(f"Target: {TARGET_SECONDS:.2f} s\n")
+    print(f"{'techs':>5} {'baseline':>10} {'adaptive':>10} {'q/tech':>7} {'covered':>8}")
+    for row in results['rows']:
+        print(f"{row['technologies']:>5} {row['baseline_seconds']:>9.3f}s {row['adaptive_seconds']:>9.3f}s "
+              f"{row['questions_per_technology']:>7} {row['covered']:>8}")
+
+    controller = results['controller']
+    print(f"\nSLO attainment: baseline {results['baseline_attainment']:.0%}, "
+          f"adaptive {results['adaptive_attainment']:.0%}")
+    print(f"Fitted model: {controller['overhead_seconds'] * 1000:.1f} ms overhead, "
+          f"{controller['seconds_per_token'] * 1000:.3f} ms/token, "
+          f"{controller['tokens_per_question']:.1f} tokens/question")
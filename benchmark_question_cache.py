@@ -0,0 +1,169 @@
+"""
+TalentScout - Question Cache Benchmark
+Replays a month of candidate tech stacks through the exact-match and the
+similarity-aware question cache, and reports hit rates, backend calls and
+question generation latency.
+
+Backend latency is modelled (fixed overhead plus a cost per output token) and
+accounted without sleeping, so a month replays in seconds.
+
+Run with: python benchmark_question_cache.py [--stacks stacks.txt]
+
+The stacks file holds one candidate's tech stack per line in arrival order;
+without it, a month of stacks is sampled from role profiles.
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import List, Optional
+
+from backends import StubBackend
+from chatbot import HiringAssistant
+from coalescing import SingleFlight
+from question_cache import QuestionCache, SimilarityQuestionCache
+from utils import estimate_tokens
+from warmup import read_stacks
+
+BACKEND_OVERHEAD = 1.2
+BACKEND_SECONDS_PER_TOKEN = 0.012
+DAYS = 30
+SCREENINGS_PER_DAY = 150
+LONG_TAIL_PROBABILITY = 0.35
+SEED = 11
+
+ROLE_PROFILES = [
+    (0.30, ['Python', 'Django'], ['PostgreSQL', 'SQL', 'Redis', 'Docker', 'AWS', 'Celery']),
+    (0.20, ['JavaScript', 'React'], ['TypeScript', 'Node.js', 'Redux', 'CSS', 'GraphQL', 'Next.js']),
+    (0.15, ['Java', 'Spring'], ['SQL', 'Kafka', 'Docker', 'Kubernetes', 'Hibernate', 'AWS']),
+    (0.10, ['Go'], ['Docker', 'Kubernetes', 'PostgreSQL', 'gRPC', 'Redis', 'AWS']),
+    (0.10, ['Python', 'Pandas'], ['NumPy', 'SQL', 'Spark', 'Airflow', 'scikit-learn', 'TensorFlow']),
+    (0.10, ['Docker', 'Kubernetes'], ['AWS', 'Terraform', 'Linux', 'Ansible', 'Go', 'Python']),
+    (0.05, ['C#', '.NET'], ['SQL', 'Azure', 'JavaScript', 'Angular', 'Docker', 'Redis']),
+]
+
+LONG_TAIL = ['Rust', 'Scala', 'Elixir', 'Ruby', 'Rails', 'PHP', 'Laravel', 'Vue', 'Svelte', 'Flask',
+             'FastAPI', 'MongoDB', 'Cassandra', 'Elasticsearch', 'RabbitMQ', 'GCP', 'Jenkins',
+             'GitHub Actions', 'Prometheus', 'Grafana', 'Snowflake', 'dbt', 'PyTorch', 'Kotlin',
+             'Swift', 'Flutter', 'Dart', 'C++', 'Haskell', 'Clojure', 'OCaml', 'Solidity']
+
+SPELLINGS = {
+    'Python': ['Python', 'python', 'py'],
+    'JavaScript': ['JavaScript', 'javascript', 'js'],
+    'Kubernetes': ['Kubernetes', 'k8s'],
+    'PostgreSQL': ['PostgreSQL', 'postgres'],
+    'Go': ['Go', 'golang'],
+}
+
+
+class ModelledBackend(StubBackend):
+    """
+    Stub backend that accounts modelled latency per call instead of sleeping.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.seconds = 0.0
+
+    def generate_content(self, prompt: str, generation_config=None, stream: bool = False):
+        response = super().generate_content(prompt, generation_config)
+        self.seconds += BACKEND_OVERHEAD + BACKEND_SECONDS_PER_TOKEN * estimate_tokens(response.text)
+        return response
+
+
+def sample_month(rng: random.Random) -> List[str]:
+    """
+    Sample a month of tech stacks from the role profiles.
+
+    Args:
+        rng: Random generator
+
+    Returns:
+        Comma-separated tech stacks in arrival order
+    """
+    weights = [weight for weight, _, _ in ROLE_PROFILES]
+    stacks = []
+    for _ in range(DAYS * SCREENINGS_PER_DAY):
+        _, core, extras = rng.choices(ROLE_PROFILES, weights)[0]
+        technologies = core + rng.sample(extras, rng.choice([1, 1, 2, 2, 3]))
+        if rng.random() < LONG_TAIL_PROBABILITY:
+            technologies.append(rng.choice(LONG_TAIL))
+        rng.shuffle(technologies)
+        stacks.append(', '.join(rng.choice(SPELLINGS.get(tech, [tech])) for tech in technologies))
+    return stacks
+
+
+def replay(stacks: List[str], cache: QuestionCache) -> dict:
+    """
+    Screen every stack in order against one cache.
+
+    Args:
+        stacks: Tech stacks in arrival order
+        cache: Question cache under test
+
+    Returns:
+        Dictionary with latency percentiles, backend usage and cache stats
+    """
+    backend = ModelledBackend()
+    flights = SingleFlight()
+    latencies = []
+
+    for stack in stacks:
+        assistant = HiringAssistant(api_key='', model=backend)
+        assistant.question_cache = cache
+        assistant.question_flights = flights
+        assistant.candidate_data = {'tech_stack': stack}
+        assistant.current_field_index = len(assistant.flow)
+
+        backend_before = backend.seconds
+        start = time.perf_counter()
+        assistant.process_user_response("ok")
+        latencies.append(time.perf_counter() - start + backend.seconds - backend_before)
+
+    latencies.sort()
+    return {
+        'mean_seconds': statistics.mean(latencies),
+        'p50_seconds': latencies[len(latencies) // 2],
+        'p95_seconds': latencies[int(len(latencies) * 0.95)],
+        'backend_calls': backend.calls,
+        'backend_seconds': backend.seconds,
+        'cache': cache.stats(),
+    }
+
+
+def run_benchmark(stacks: Optional[List[str]] = None) -> dict:
+    """
+    Replay the same stacks through both cache modes.
+
+    Args:
+        stacks: Tech stacks in arrival order; a sampled month if omitted
+
+    Returns:
+        Dictionary with the screening count and results per mode
+    """
+    stacks = stacks or sample_month(random.Random(SEED))
+    return {
+        'screenings': len(stacks),
+        'exact': replay(stacks, QuestionCache()),
+        'similarity': replay(stacks, SimilarityQuestionCache()),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare exact and similarity-aware question caching.")
+    parser.add_argument('--stacks', help="File with one tech stack per line, in arrival order")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("TalentScout - Question Cache Benchmark")
+    print("=" * 70)
+
+    results = run_benchmark(read_stacks(args.stacks) if args.stacks else None)
+    print(f"Screenings replayed: {results['screenings']}\n")
+    print(f"{'mode':<11} {'exact hits':>10} {'partial':>8} {'calls':>6} {'mean':>7} {'p50':>7} {'p95':>7}")
+    for mode in ('exact', 'similarity'):
+        row = results[mode]
+        print(f"{mode:<11} {row['cache']['hit_rate']:>10.1%} {row['cache'].get('partial_hit_rate', 0.0):>8.1%} "
+              f"{row['backend_calls']:>6} {row['mean_seconds']:>6.2f}s {row['p50_seconds']:>6.2f}s "
+              f"{row['p95_seconds']:>6.2f}s")
@@ -0,0 +1,108 @@
+"""
+TalentScout - Technology Matching Benchmark
+Measures typo-correction lookup latency against a large synthetic vocabulary.
+
+Run with: python benchmark_tech_matching.py
+"""
+
+import random
+import string
+import time
+
+from tech_matching import TechMatcher
+from utils import TECH_ALIASES
+
+VOCABULARY_SIZE = 12000
+LOOKUPS = 5000
+SEED = 42
+
+
+def build_vocabulary(size: int, rng: random.Random) -> dict:
+    """
+    Build a vocabulary of real aliases padded with synthetic technology names.
+
+    Args:
+        size: Target number of terms
+        rng: Random number generator
+
+    Returns:
+        Mapping of lowercase term to canonical name
+    """
+    vocabulary = dict(TECH_ALIASES)
+    while len(vocabulary) < size:
+        length = rng.randint(5, 14)
+        term = ''.join(rng.choice(string.ascii_lowercase) for _ in range(length))
+        vocabulary[term] = term.capitalize()
+    return vocabulary
+
+
+def misspell(term: str, rng: random.Random) -> str:
+    """
+    Introduce a single random typo (swap, drop, duplicate or substitute).
+
+    Args:
+        term: Correct term
+        rng: Random number generator
+
+    Returns:
+        Misspelled term
+    """
+    i = rng.randrange(len(term) - 1)
+    kind = rng.choice(['swap', 'drop', 'double', 'substitute'])
+    if kind == 'swap':
+        return term[:i] + term[i + 1] + term[i] + term[i + 2:]
+    if kind == 'drop':
+        return term[:i] + term[i + 1:]
+    if kind == 'double':
+        return term[:i] + term[i] + term[i:]
+    return term[:i] + rng.choice(string.ascii_lowercase) + term[i + 1:]
+
+
+def run_benchmark() -> dict:
+    """
+    Build the index and time lookups of misspelled terms.
+
+    Returns:
+        Dictionary with build time, latency percentiles and correction rate
+    """
+    rng = random.Random(SEED)
+    vocabulary = build_vocabulary(VOCABULARY_SIZE, rng)
+
+    start = time.perf_counter()
+    matcher = TechMatcher(vocabulary)
+    build_seconds = time.perf_counter() - start
+
+    targets = rng.sample([term for term in vocabulary if len(term) > 4], LOOKUPS)
+    queries = [misspell(term, rng) for term in targets]
+
+    latencies = []
+    corrected = 0
+    for target, query in zip(targets, queries):
+        start = time.perf_counter()
+        match = matcher.lookup(query)
+        latencies.append(time.perf_counter() - start)
+        if match == vocabulary[target]:
+            corrected += 1
+
+    latencies.sort()
+    return {
+        'vocabulary': len(matcher),
+        'build_seconds': build_seconds,
+        'mean_us': sum(latencies) / len(latencies) * 1e6,
+        'p50_us': latencies[len(latencies) // 2] * 1e6,
+        'p99_us': latencies[int(len(latencies) * 0.99)] * 1e6,
+        'correction_rate': corrected / len(queries),
+    }
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("TalentScout - Technology Matching Benchmark")
+    print("=" * 70)
+
+    results = run_benchmark()
+    print(f"Vocabulary size:  {results['vocabulary']}")
+    print(f"Index build time: {results['build_seconds']:.2f} s")
+    print(f"Lookup latency:   mean {results['mean_us']:.1f} us, "
+          f"p50 {results['p50_us']:.1f} us, p99 {results['p99_us']:.1f} us")
+    print(f"Correction rate:  {results['correction_rate']:.1%}")
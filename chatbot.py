@@ -6,27 +6,42 @@ NOTE: All data is stored in-memory only (Streamlit session_state).
 No persistent storage is used to ensure GDPR compliance and data privacy.
 """
 
+import csv
+import io
+import json
 import os
-from typing import Dict, Optional, Tuple
-import google.generativeai as genai
+import time
+from typing import Dict, List, Optional, Tuple
 
 from prompts import (
-    SYSTEM_PROMPT,
     INFORMATION_COLLECTION_PROMPT,
-    TECHNICAL_QUESTION_GENERATION_PROMPT,
     GREETING_MESSAGE,
     EXIT_MESSAGE,
-    CANDIDATE_INFO_FIELDS
+    DEFAULT_QUESTIONS_PER_TECHNOLOGY,
+    ANSWER_COLLECTION_INTRO,
+    ANSWER_QUESTION_TEMPLATE,
+    ANSWERS_COMPLETE_MESSAGE,
+    UNCLEAR_INPUT_MESSAGE,
+    RETURNING_CANDIDATE_MESSAGE
 )
+from answer_scoring import KeywordScorer, parse_questions, strip_keyword_lines
+from batching import build_question_prompt
+from coalescing import SingleFlight
+from conversation_flow import ConversationFlow, DEFAULT_FLOW
+from extraction import extract_candidate_fields, may_contain_several_fields
+from latency_slo import GenerationPlan
+from question_cache import QuestionCache, split_technology_blocks, technology_key
 from utils import (
     parse_tech_stack,
-    validate_email,
-    validate_phone,
-    validate_experience,
+    tech_stack_key,
+    estimate_tokens,
     is_exit_command,
     sanitize_input
 )
 
+QUESTION_FLIGHTS = SingleFlight()
+QUESTION_CACHE = QuestionCache()
+
 
 class HiringAssistant:
     """
@@ -34,20 +49,42 @@ class HiringAssistant:
     Manages conversation state, candidate data collection, and technical question generation.
     """
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, model=None, flow: Optional[ConversationFlow] = None):
         """
         Initialize the Hiring Assistant chatbot.
 
         Args:
             api_key: Google Gemini API key
+            model: Optional object exposing generate_content(prompt), used instead
+                of the Gemini model (e.g. a stub backend for offline runs)
+            flow: Compiled screening flow; defaults to CANDIDATE_INFO_FIELDS
         """
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-pro')
+        if model is None:
+            import google.generativeai as genai
+            genai.configure(api_key=api_key)
+            model = genai.GenerativeModel('gemini-pro')
+        self.model = model
+        self.flow = flow or DEFAULT_FLOW
+
+        self.multi_field_extraction = True
+        self.question_flights = QUESTION_FLIGHTS
+        self.question_cache = QUESTION_CACHE
+        self.question_batcher = None
+        self.profiler = None
+        self.latency_controller = None
+        self.collect_answers = False
+        self.returning_candidates = None
+        self.analytics = None
 
         self.current_field_index = 0
         self.candidate_data = {}
         self.conversation_active = True
         self.tech_questions_generated = False
+        self.questions_response = ''
+        self.questions: List[Dict] = []
+        self.answers: List[Dict] = []
+        self.current_question_index = 0
+        self._scorer: Optional[KeywordScorer] = None
 
     def get_greeting(self) -> str:
         """
@@ -61,6 +98,7 @@ class HiringAssistant:
     def should_exit(self, user_input: str) -> bool:
         """
         Check if conversation should end based on user input.
+        While answers are being collected, only a bare exit command ends it.
 
         Args:
             user_input: User's message
@@ -68,7 +106,7 @@ class HiringAssistant:
         Returns:
             True if conversation should end, False otherwise
         """
-        return is_exit_command(user_input)
+        return is_exit_command(user_input, exact=self._collecting_answers())
 
     def get_exit_message(self) -> str:
         """
@@ -87,14 +125,28 @@ class HiringAssistant:
         Returns:
             Next question string, or None if all information is collected
         """
-        if self.current_field_index < len(CANDIDATE_INFO_FIELDS):
-            return CANDIDATE_INFO_FIELDS[self.current_field_index]['prompt']
-        return None
+        return self.flow.prompt_for(self.current_field_index)
 
     def process_user_response(self, user_input: str) -> Tuple[str, bool]:
         """
         Process user response and determine next action.
 
+        Args:
+            user_input: User's message
+
+        Returns:
+            Tuple of (bot_response, should_continue)
+        """
+        if self.profiler is not None:
+            with self.profiler.capture('process_user_response'):
+                return self._process_user_response(user_input)
+
+        return self._process_user_response(user_input)
+
+    def _process_user_response(self, user_input: str) -> Tuple[str, bool]:
+        """
+        Route a user response to the current conversation stage.
+
         Args:
             user_input: User's message
 
@@ -106,10 +158,12 @@ class HiringAssistant:
         if self.should_exit(user_input):
             return self.get_exit_message(), False
 
-        if self.current_field_index < len(CANDIDATE_INFO_FIELDS):
+        if self.current_field_index < len(self.flow):
             return self._collect_candidate_info(user_input)
         elif not self.tech_questions_generated:
             return self._generate_technical_questions()
+        elif self._collecting_answers():
+            return self._collect_answer(user_input)
         else:
             return "All questions have been asked. Thank you for your time!", False
 
@@ -123,56 +177,125 @@ class HiringAssistant:
         Returns:
             Tuple of (bot_response, should_continue)
         """
-        current_field = CANDIDATE_INFO_FIELDS[self.current_field_index]['field']
+        if self.multi_field_extraction and may_contain_several_fields(user_input):
+            extracted = extract_candidate_fields(user_input, self._missing_fields())
+            if extracted:
+                return self._apply_extracted_fields(extracted)
+
+        current_field = self.flow.states[self.current_field_index].field
 
         validation_result = self._validate_field(current_field, user_input)
 
         if not validation_result[0]:
             return validation_result[1], True
 
+        had_contact_details = self._has_contact_details()
         self.candidate_data[current_field] = validation_result[1]
 
-        if current_field == 'tech_stack':
-            self.candidate_data[current_field] = parse_tech_stack(user_input)
+        self.current_field_index = self.flow.next_index(self.current_field_index, self.candidate_data)
+        return (self._resume_returning_candidate(had_contact_details) or
+                (self.flow.response_for(self.current_field_index), True))
 
-        self.current_field_index += 1
+    def _missing_fields(self) -> list:
+        """
+        Get the fields that still need to be collected, in flow order.
+        Only called for messages that may hold several fields.
 
-        if self.current_field_index < len(CANDIDATE_INFO_FIELDS):
-            next_question = self.get_next_question()
-            return f"Thank you! {next_question}", True
-        else:
-            return "Great! I have all the information I need. Let me generate some technical questions based on your tech stack...", True
+        Returns:
+            List of field names not yet present in candidate data
+        """
+        return [
+            field
+            for field in self.flow.remaining_fields[self.current_field_index]
+            if field not in self.candidate_data
+        ]
 
-    def _validate_field(self, field: str, value: str) -> Tuple[bool, str]:
+    def _apply_extracted_fields(self, extracted: Dict) -> Tuple[str, bool]:
         """
-        Validate user input for specific field.
+        Store every valid field extracted from a multi-field message.
 
         Args:
-            field: Field name being validated
-            value: User input value
+            extracted: Field name to value mapping from extract_candidate_fields
 
         Returns:
-            Tuple of (is_valid, value_or_error_message)
+            Tuple of (bot_response, should_continue)
+        """
+        had_contact_details = self._has_contact_details()
+        for field, value in extracted.items():
+            is_valid, result = self._validate_field(field, value)
+            if is_valid:
+                self.candidate_data[field] = result
+
+        self.current_field_index = self.flow.resolve(self.current_field_index, self.candidate_data)
+        return (self._resume_returning_candidate(had_contact_details) or
+                (self.flow.response_for(self.current_field_index), True))
+
+    def _has_contact_details(self) -> bool:
+        """
+        Check whether both email and phone have been collected.
+
+        Returns:
+            True if candidate data holds an email and a phone number
+        """
+        return 'email' in self.candidate_data and 'phone' in self.candidate_data
+
+    def _resume_returning_candidate(self, had_contact_details: bool) -> Optional[Tuple[str, bool]]:
+        """
+        Show the questions from a recently completed screening once email and
+        phone are known, so a candidate who reset the conversation is not
+        screened twice. Only the questions are restored; details and answers
+        from the earlier session are never shown again.
+
+        The index is consulted once, on the turn both identifiers become known.
+
+        Args:
+            had_contact_details: Whether email and phone were known before this turn
+
+        Returns:
+            Tuple of (bot_response, should_continue) if the candidate was resumed, otherwise None
         """
-        if not value or not value.strip():
-            return False, "I didn't quite understand that. Could you please rephrase?"
+        if self.returning_candidates is None or self.tech_questions_generated:
+            return None
+        if had_contact_details or not self._has_contact_details():
+            return None
+
+        previous = self.returning_candidates.lookup(self.candidate_data['email'], self.candidate_data['phone'])
+        if previous is None:
+            return None
+
+        self.current_field_index = len(self.flow)
+        self.tech_questions_generated = True
+        self.questions_response = previous
+        self.conversation_active = False
+        name = self.candidate_data.get('full_name') or 'there'
+        return RETURNING_CANDIDATE_MESSAGE.format(name=name) + "\n\n" + previous, False
 
-        if field == 'email':
-            if not validate_email(value):
-                return False, "That doesn't appear to be a valid email address. Could you please provide a valid email?"
-            return True, value.strip()
+    def _complete_screening(self):
+        """
+        Record a completed screening in the analytics store, and its generated
+        questions in the returning-candidate index.
+        """
+        if self.analytics is not None:
+            self.analytics.add(self.candidate_data)
 
-        elif field == 'phone':
-            if not validate_phone(value):
-                return False, "That doesn't appear to be a valid phone number. Could you please provide a valid phone number?"
-            return True, value.strip()
+        if self.returning_candidates is None or not self._has_contact_details():
+            return
 
-        elif field == 'experience':
-            if not validate_experience(value):
-                return False, "Please provide a valid number of years of experience (e.g., '5' or '2.5 years')."
-            return True, value.strip()
+        self.returning_candidates.remember(
+            self.candidate_data['email'], self.candidate_data['phone'], self.questions_response)
+
+    def _validate_field(self, field: str, value: str) -> Tuple[bool, str]:
+        """
+        Validate user input for specific field using the compiled flow.
+
+        Args:
+            field: Field name being validated
+            value: User input value
 
-        return True, value.strip()
+        Returns:
+            Tuple of (is_valid, value_or_error_message)
+        """
+        return self.flow.validate(field, value)
 
     def _generate_technical_questions(self) -> Tuple[str, bool]:
         """
@@ -192,25 +315,275 @@ class HiringAssistant:
             tech_stack_str = str(tech_stack)
 
         try:
-            prompt = TECHNICAL_QUESTION_GENERATION_PROMPT.format(tech_stack=tech_stack_str)
-
-            full_prompt = f"{SYSTEM_PROMPT}\n\n{prompt}"
-
-            response = self.model.generate_content(full_prompt)
-
-            questions = response.text
+            tech_stack_str, questions = self._get_questions(tech_stack_str)
 
             self.tech_questions_generated = True
 
             intro = f"\nBased on your experience with {tech_stack_str}, here are some technical questions:\n\n"
+            self.questions_response = intro + strip_keyword_lines(questions)
 
-            return intro + questions, False
+            if self.collect_answers:
+                self.questions = parse_questions(questions)
+                self.answers = []
+                self.current_question_index = 0
+                self._scorer = None
+                if self.questions:
+                    return (self.questions_response + "\n\n" + ANSWER_COLLECTION_INTRO +
+                            "\n\n" + self._question_prompt(0)), True
+
+            self._complete_screening()
+            return self.questions_response, False
 
         except Exception as e:
             error_msg = "I apologize, but I encountered an issue generating technical questions. Our team will follow up with you shortly."
             print(f"Error generating questions: {str(e)}")
             return error_msg, False
 
+    def _collecting_answers(self) -> bool:
+        """
+        Check whether the session is waiting for answers to generated questions.
+
+        Returns:
+            True if answer collection is on and questions remain unanswered
+        """
+        return (self.collect_answers and self.tech_questions_generated
+                and self.current_question_index < len(self.questions))
+
+    def _question_prompt(self, index: int) -> str:
+        """
+        Format one generated question for asking on its own.
+
+        Args:
+            index: Question index
+
+        Returns:
+            Question message
+        """
+        question = self.questions[index]
+        return ANSWER_QUESTION_TEMPLATE.format(
+            number=index + 1, total=len(self.questions),
+            technology=question['technology'], question=question['question'])
+
+    def _answer_scorer(self) -> KeywordScorer:
+        """
+        Get the keyword scorer for this session's questions, building it on first use.
+
+        Returns:
+            KeywordScorer over the expected-concept keywords of each question
+        """
+        if self._scorer is None:
+            self._scorer = KeywordScorer([question['keywords'] for question in self.questions])
+        return self._scorer
+
+    def _collect_answer(self, user_input: str) -> Tuple[str, bool]:
+        """
+        Store and score the answer to the current question, then ask the next one.
+        Scores are kept for the recruitment team and not shown to the candidate.
+
+        Args:
+            user_input: Candidate's answer
+
+        Returns:
+            Tuple of (bot_response, should_continue)
+        """
+        if not user_input:
+            return UNCLEAR_INPUT_MESSAGE, True
+
+        index = self.current_question_index
+        question = self.questions[index]
+        scorer = self._answer_scorer()
+
+        self.answers.append({
+            'technology': question['technology'],
+            'question': question['question'],
+            'answer': user_input,
+            'score': round(float(scorer.score([index], [user_input])[0]), 3),
+            'matched_keywords': scorer.matched_keywords(index, user_input),
+            'expected_keywords': scorer.question_terms[index],
+        })
+        self.current_question_index += 1
+
+        if self.current_question_index < len(self.questions):
+            return self._question_prompt(self.current_question_index), True
+
+        self._complete_screening()
+        return ANSWERS_COMPLETE_MESSAGE, False
+
+    def export_answers(self, fmt: str = 'json', include_scores: bool = True) -> str:
+        """
+        Export collected answers and their scores.
+
+        Args:
+            fmt: 'json' for a document including candidate details, or 'csv' for one row per answer
+            include_scores: Include scores and keywords; disable for copies shown to the candidate
+
+        Returns:
+            Exported text
+        """
+        if fmt == 'csv':
+            output = io.StringIO()
+            writer = csv.writer(output)
+            header = ['technology', 'question', 'answer']
+            if include_scores:
+                header += ['score', 'matched_keywords', 'expected_keywords']
+            writer.writerow(header)
+            for answer in self.answers:
+                row = [answer['technology'], answer['question'], answer['answer']]
+                if include_scores:
+                    row += [answer['score'], '; '.join(answer['matched_keywords']),
+                            '; '.join(answer['expected_keywords'])]
+                writer.writerow(row)
+            return output.getvalue()
+
+        if fmt != 'json':
+            raise ValueError(f"Unsupported export format: {fmt}")
+
+        if not include_scores:
+            return json.dumps({
+                'candidate': self.candidate_data,
+                'answers': [{key: answer[key] for key in ('technology', 'question', 'answer')}
+                            for answer in self.answers],
+            }, indent=2)
+
+        scores = [answer['score'] for answer in self.answers]
+        return json.dumps({
+            'candidate': self.candidate_data,
+            'answers': self.answers,
+            'average_score': round(sum(scores) / len(scores), 3) if scores else None,
+        }, indent=2)
+
+    def prefetch_questions(self, technologies: List[str]) -> str:
+        """
+        Generate and cache questions for a tech stack without changing conversation state.
+
+        Args:
+            technologies: Normalized technologies
+
+        Returns:
+            Generated or cached question text
+        """
+        return self._get_questions(', '.join(technologies))[1]
+
+    def _get_questions(self, tech_stack_str: str) -> Tuple[str, str]:
+        """
+        Get questions for a tech stack from the cache or the backend.
+        Concurrent requests for the same normalized tech stack share one backend call,
+        and distinct requests are combined when a micro-batcher is attached.
+        With a latency controller attached, the request is sized to its latency target.
+
+        Args:
+            tech_stack_str: Comma-separated technologies
+
+        Returns:
+            Tuple of (technologies covered, question text)
+        """
+        plan = None
+        if self.latency_controller is not None:
+            plan = self.latency_controller.plan(parse_tech_stack(tech_stack_str))
+            tech_stack_str = ', '.join(plan.technologies)
+
+        key = (
+            tech_stack_key(parse_tech_stack(tech_stack_str)),
+            plan.questions_per_technology if plan is not None else DEFAULT_QUESTIONS_PER_TECHNOLOGY,
+            self.collect_answers
+        )
+
+        questions = self.question_cache.get(key)
+        if questions is None:
+            questions = self.question_flights.do(
+                key,
+                lambda: self._generate_and_cache(key, tech_stack_str, plan)
+            )
+
+        return tech_stack_str, questions
+
+    def _generate_and_cache(self, key: tuple, tech_stack_str: str, plan: Optional[GenerationPlan]) -> str:
+        """
+        Request questions from the backend and store them in the question cache.
+        A similarity-aware cache may cover part of the stack from cached
+        technology blocks, in which case only the rest is generated.
+
+        Args:
+            key: Cache key for the request
+            tech_stack_str: Comma-separated technologies
+            plan: Optional latency controller decision for this request
+
+        Returns:
+            Generated question text
+        """
+        cover = getattr(self.question_cache, 'cover', None)
+        covered, missing = cover(key) if cover is not None else ({}, [])
+
+        if covered:
+            questions = self._assemble_questions(tech_stack_str, covered, missing, plan)
+        else:
+            questions = self._request_questions(tech_stack_str, plan)
+
+        self.question_cache.put(key, questions)
+        return questions
+
+    def _assemble_questions(self, tech_stack_str: str, covered: Dict[str, str],
+                            missing: List[str], plan: Optional[GenerationPlan]) -> str:
+        """
+        Combine cached technology blocks with newly generated ones, in the listed order.
+
+        Args:
+            tech_stack_str: Comma-separated technologies
+            covered: Technology key to cached block text
+            missing: Technology keys to generate
+            plan: Optional latency controller decision for the full request
+
+        Returns:
+            Question text covering every technology
+        """
+        names = {}
+        for tech in parse_tech_stack(tech_stack_str):
+            names.setdefault(technology_key(tech), tech)
+
+        blocks = dict(covered)
+        unmatched = ''
+        if missing:
+            missing_names = [names.get(tech, tech) for tech in missing]
+            generated = self._request_questions(
+                ', '.join(missing_names), plan.restricted_to(missing_names) if plan is not None else None)
+            for heading, block in split_technology_blocks(generated):
+                blocks.setdefault(technology_key(heading), block)
+            if any(tech not in blocks for tech in missing):
+                unmatched = generated
+
+        ordered = [blocks[tech] for tech in names if tech in blocks and not (unmatched and tech in missing)]
+        if unmatched:
+            ordered.append(unmatched.strip())
+        return '\n\n'.join(ordered)
+
+    def _request_questions(self, tech_stack_str: str, plan: Optional[GenerationPlan] = None) -> str:
+        """
+        Send a question generation request to the backend.
+        Planned requests carry their own output token cap, and requests for answer
+        keywords need their own instructions, so both bypass the micro-batcher.
+
+        Args:
+            tech_stack_str: Comma-separated technologies
+            plan: Optional latency controller decision for this request
+
+        Returns:
+            Generated question text
+        """
+        if plan is not None:
+            start = time.perf_counter()
+            questions = self.model.generate_content(
+                build_question_prompt(tech_stack_str, plan.questions_per_technology, self.collect_answers),
+                generation_config={'max_output_tokens': plan.max_output_tokens}
+            ).text
+            self.latency_controller.observe(time.perf_counter() - start, estimate_tokens(questions), plan)
+            return questions
+
+        if self.question_batcher is not None and not self.collect_answers:
+            return self.question_batcher.generate(tech_stack_str)
+
+        return self.model.generate_content(
+            build_question_prompt(tech_stack_str, with_keywords=self.collect_answers)).text
+
     def get_state(self) -> Dict:
         """
         Get current chatbot state for persistence.
@@ -222,7 +595,11 @@ class HiringAssistant:
             'current_field_index': self.current_field_index,
             'candidate_data': self.candidate_data,
             'conversation_active': self.conversation_active,
-            'tech_questions_generated': self.tech_questions_generated
+            'tech_questions_generated': self.tech_questions_generated,
+            'questions_response': self.questions_response,
+            'questions': self.questions,
+            'answers': self.answers,
+            'current_question_index': self.current_question_index
         }
 
     def set_state(self, state: Dict):
@@ -236,3 +613,8 @@ class HiringAssistant:
         self.candidate_data = state.get('candidate_data', {})
         self.conversation_active = state.get('conversation_active', True)
         self.tech_questions_generated = state.get('tech_questions_generated', False)
+        self.questions_response = state.get('questions_response', '')
+        self.questions = state.get('questions', [])
+        self.answers = state.get('answers', [])
+        self.current_question_index = state.get('current_question_index', 0)
+        self._scorer = None
@@ -0,0 +1,112 @@
+"""
+TalentScout Hiring Assistant - Request Coalescing
+This module collapses identical in-flight LLM requests into a single backend call.
+"""
+
+import asyncio
+import threading
+from typing import Callable, Dict, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+class _Call:
+    """
+    A single in-flight call whose outcome is shared by every waiter.
+    """
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Single-flight request coalescing.
+
+    The first caller for a key (the leader) runs the function; callers arriving
+    with the same key while it is still running (followers) block until it
+    finishes and receive the same result, or the same exception. Once the call
+    completes the key is released, so later callers trigger a fresh call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.leader_calls = 0
+        self.coalesced_calls = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Run fn once per key among concurrent callers.
+
+        Args:
+            key: Normalized request key
+            fn: Zero-argument callable performing the request
+
+        Returns:
+            Result of fn, shared with every concurrent caller of the same key
+
+        Raises:
+            Any exception raised by fn, re-raised in every waiting caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self._calls[key] = call
+                self.leader_calls += 1
+            else:
+                self.coalesced_calls += 1
+
+        if not is_leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    async def do_async(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        Asyncio variant of do(); waits in an executor so the event loop is not blocked.
+
+        Async and threaded callers share the same in-flight table, so they coalesce
+        with each other.
+
+        Args:
+            key: Normalized request key
+            fn: Zero-argument blocking callable performing the request
+
+        Returns:
+            Result of fn, shared with every concurrent caller of the same key
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.do, key, fn)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get coalescing counters.
+
+        Returns:
+            Dictionary with leader, coalesced and in-flight call counts
+        """
+        with self._lock:
+            in_flight = len(self._calls)
+        return {
+            'leader_calls': self.leader_calls,
+            'coalesced_calls': self.coalesced_calls,
+            'in_flight': in_flight,
+        }
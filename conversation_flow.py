@@ -0,0 +1,317 @@
+"""
+TalentScout Hiring Assistant - Declarative Screening Flow
+This module compiles a field schema into a table-driven state machine.
+
+A schema is a list of field dicts, as in CANDIDATE_INFO_FIELDS, or a JSON file
+of the form {"name": ..., "fields": [...]}. Each field supports:
+
+    field       Name under which the answer is stored (required)
+    prompt      Question asked for the field (required)
+    validator   Named validator: "email", "phone" or "experience"
+    pattern     Regular expression the answer must fully match
+    error       Message shown when validation fails
+    normalizer  Named normalizer: "strip" (default), "lower" or "tech_stack"
+    next        Field to move to after this one (default: the next in the list)
+    branches    List of {"if": condition, "goto": field}; the first match wins
+    skip_if     Condition under which the field is not asked
+
+A condition is {"field": name, <operator>: operand} with operator one of
+"equals", "contains", "not_contains", "in", "lt" or "gt". "lt" and "gt"
+compare years of experience parsed with the experience validation rules.
+"""
+
+import json
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+from prompts import CANDIDATE_INFO_FIELDS, INFO_COMPLETE_MESSAGE, UNCLEAR_INPUT_MESSAGE
+from tech_matching import TECH_MATCHER
+from utils import (
+    parse_experience,
+    parse_tech_stack,
+    validate_email,
+    validate_phone,
+    validate_experience
+)
+
+VALIDATORS: Dict[str, Callable[[str], bool]] = {
+    'email': validate_email,
+    'phone': validate_phone,
+    'experience': validate_experience,
+}
+
+NORMALIZERS: Dict[str, Callable[[str], object]] = {
+    'strip': str.strip,
+    'lower': lambda value: value.strip().lower(),
+    'tech_stack': lambda value: TECH_MATCHER.correct(parse_tech_stack(value)),
+}
+
+DEFAULT_ERROR = "That doesn't look right. Could you please check and try again?"
+
+
+def _as_text(value) -> str:
+    """
+    Render a stored answer as lowercase text for condition matching.
+
+    Args:
+        value: Stored field value (string or list)
+
+    Returns:
+        Lowercase string
+    """
+    if isinstance(value, list):
+        return ', '.join(value).lower()
+    return str(value).lower()
+
+
+def _compile_condition(condition: Dict) -> Callable[[Dict], bool]:
+    """
+    Compile a condition dict into a predicate over candidate data.
+
+    Args:
+        condition: Condition from the schema
+
+    Returns:
+        Function taking candidate data and returning True if the condition holds
+
+    Raises:
+        ValueError: If the condition has no supported operator
+    """
+    field = condition['field']
+
+    if 'equals' in condition:
+        operand = str(condition['equals']).lower()
+        return lambda data: field in data and _as_text(data[field]) == operand
+
+    if 'contains' in condition:
+        operand = str(condition['contains']).lower()
+        return lambda data: field in data and operand in _as_text(data[field])
+
+    if 'not_contains' in condition:
+        operand = str(condition['not_contains']).lower()
+        return lambda data: field in data and operand not in _as_text(data[field])
+
+    if 'in' in condition:
+        operands = frozenset(str(item).lower() for item in condition['in'])
+        return lambda data: field in data and _as_text(data[field]) in operands
+
+    for operator, compare in (('lt', lambda a, b: a < b), ('gt', lambda a, b: a > b)):
+        if operator in condition:
+            operand = float(condition[operator])
+
+            def predicate(data, compare=compare, operand=operand):
+                years = parse_experience(_as_text(data.get(field, '')))
+                return years is not None and compare(years, operand)
+            return predicate
+
+    raise ValueError(f"Unsupported condition in screening flow: {condition}")
+
+
+class FieldState:
+    """
+    One compiled state of the screening flow.
+    """
+
+    def __init__(self, spec: Dict):
+        """
+        Compile validators, normalizers and conditions for one field.
+
+        Args:
+            spec: Field dict from the schema
+        """
+        self.field = spec['field']
+        self.prompt = spec['prompt']
+        self.ack = f"Thank you! {self.prompt}"
+        self.error = spec.get('error', DEFAULT_ERROR)
+
+        self.validator = VALIDATORS[spec['validator']] if spec.get('validator') else None
+        self.pattern = re.compile(spec['pattern']) if spec.get('pattern') else None
+        self.normalizer = NORMALIZERS[spec.get('normalizer', 'strip')]
+
+        self.skip_if = _compile_condition(spec['skip_if']) if spec.get('skip_if') else None
+        self.branch_specs = spec.get('branches', [])
+        self.next_spec = spec.get('next')
+
+        self.branches: List[Tuple[Callable[[Dict], bool], int]] = []
+        self.default_next = 0
+
+    def validate(self, value: str) -> Tuple[bool, object]:
+        """
+        Validate and normalize an answer for this field.
+
+        Args:
+            value: User input value
+
+        Returns:
+            Tuple of (is_valid, normalized_value_or_error_message)
+        """
+        if not value or not value.strip():
+            return False, UNCLEAR_INPUT_MESSAGE
+
+        if self.validator is not None and not self.validator(value):
+            return False, self.error
+
+        if self.pattern is not None and not self.pattern.fullmatch(value.strip()):
+            return False, self.error
+
+        return True, self.normalizer(value)
+
+
+class ConversationFlow:
+    """
+    Table-driven screening state machine.
+
+    States are addressed by index; the current state, its validator and the
+    acknowledgement for the next question are all direct lookups, so the work
+    per message does not grow with the number of fields in the flow.
+    """
+
+    def __init__(self, fields: List[Dict], name: str = 'default'):
+        """
+        Compile a schema into states and resolve transitions to indexes.
+
+        Args:
+            fields: List of field dicts
+            name: Flow name, e.g. the role it is used for
+
+        Raises:
+            ValueError: If a transition names an unknown field
+        """
+        self.name = name
+        self.states = [FieldState(spec) for spec in fields]
+        self.index = {state.field: i for i, state in enumerate(self.states)}
+        self.fields = [state.field for state in self.states]
+        self.remaining_fields = [tuple(self.fields[i:]) for i in range(len(self.fields) + 1)]
+
+        for i, state in enumerate(self.states):
+            state.default_next = self._resolve_field(state.next_spec) if state.next_spec else i + 1
+            state.branches = [
+                (_compile_condition(branch['if']), self._resolve_field(branch['goto']))
+                for branch in state.branch_specs
+            ]
+
+    def _resolve_field(self, field: str) -> int:
+        """
+        Map a field name used in a transition to its state index.
+
+        Args:
+            field: Target field name
+
+        Returns:
+            State index
+        """
+        if field not in self.index:
+            raise ValueError(f"Screening flow '{self.name}' refers to unknown field '{field}'")
+        return self.index[field]
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def prompt_for(self, index: int) -> Optional[str]:
+        """
+        Get the question for a state.
+
+        Args:
+            index: State index
+
+        Returns:
+            Prompt string, or None if the flow is complete
+        """
+        if index < len(self.states):
+            return self.states[index].prompt
+        return None
+
+    def validate(self, field: str, value: str) -> Tuple[bool, object]:
+        """
+        Validate and normalize an answer for a named field.
+
+        Args:
+            field: Field name
+            value: User input value
+
+        Returns:
+            Tuple of (is_valid, normalized_value_or_error_message)
+        """
+        return self.states[self.index[field]].validate(value)
+
+    def next_index(self, index: int, data: Dict) -> int:
+        """
+        Follow the transition out of a state, applying branches and skip rules.
+
+        Args:
+            index: Index of the state just answered
+            data: Candidate data collected so far
+
+        Returns:
+            Index of the next state to ask, or len(self) when the flow is complete
+        """
+        return self.resolve(self._transition(self.states[index], data), data)
+
+    def _transition(self, state: FieldState, data: Dict) -> int:
+        """
+        Get the state that follows a given state: the first matching branch, or the default.
+
+        Args:
+            state: State being left
+            data: Candidate data collected so far
+
+        Returns:
+            Index of the following state
+        """
+        for predicate, branch_target in state.branches:
+            if predicate(data):
+                return branch_target
+        return state.default_next
+
+    def resolve(self, index: int, data: Dict) -> int:
+        """
+        Move past states that are already answered or whose skip rule holds,
+        following their branches as if they had just been answered.
+
+        Args:
+            index: Candidate state index
+            data: Candidate data collected so far
+
+        Returns:
+            Index of the first state that still needs an answer
+        """
+        for _ in range(len(self.states)):
+            if index >= len(self.states):
+                break
+            state = self.states[index]
+            if state.field not in data and (state.skip_if is None or not state.skip_if(data)):
+                break
+            index = self._transition(state, data)
+        return index
+
+    def response_for(self, index: int) -> str:
+        """
+        Get the precomputed reply that introduces a state.
+
+        Args:
+            index: State index
+
+        Returns:
+            Acknowledgement with the next question, or the completion message
+        """
+        if index < len(self.states):
+            return self.states[index].ack
+        return INFO_COMPLETE_MESSAGE
+
+
+def load_flow(path: str) -> ConversationFlow:
+    """
+    Load and compile a screening flow from a JSON file.
+
+    Args:
+        path: Path to the flow file
+
+    Returns:
+        Compiled ConversationFlow
+    """
+    with open(path, 'r') as f:
+        schema = json.load(f)
+    return ConversationFlow(schema['fields'], name=schema.get('name', path))
+
+
+DEFAULT_FLOW = ConversationFlow(CANDIDATE_INFO_FIELDS)
@@ -0,0 +1,177 @@
+"""
+TalentScout Hiring Assistant - Local Multi-Field Extraction
+This module identifies several candidate fields in a single message without
+calling the LLM, so a candidate who pastes all details at once is not asked
+for them again one by one.
+"""
+
+import re
+from typing import Dict, Iterable, List
+
+from utils import (
+    normalize_tech_name,
+    validate_email,
+    validate_phone,
+    validate_experience
+)
+
+SEGMENT_SPLIT_PATTERN = re.compile(r'[,;\n|]+')
+EMAIL_SEARCH_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_SEARCH_PATTERN = re.compile(r'\+?\(?\d[\d\s\-().]{8,}\d')
+EXPERIENCE_SEARCH_PATTERN = re.compile(r'^(\d+(?:\.\d+)?)\s*\+?\s*(?:years?|yrs?)(?:\s+(?:of\s+)?experience)?$', re.IGNORECASE)
+TECH_TOKEN_SPLIT_PATTERN = re.compile(r'[\s/]+')
+
+POSITION_KEYWORDS = frozenset([
+    'engineer', 'developer', 'backend', 'back-end', 'frontend', 'front-end',
+    'fullstack', 'full-stack', 'devops', 'sre', 'scientist', 'analyst',
+    'architect', 'manager', 'intern', 'designer', 'lead', 'programmer',
+    'administrator', 'consultant', 'tester', 'qa'
+])
+
+FREE_TEXT_FIELDS = ('full_name', 'position', 'location')
+
+HARD_PATTERN_FIELDS = frozenset(['email', 'phone', 'experience'])
+
+MIN_CONFIDENT_FIELDS = 2
+
+
+def _is_tech_segment(segment: str) -> bool:
+    """
+    Check whether every token of a segment is a known technology or alias.
+
+    Matching is exact: fuzzy matching would turn ordinary words into
+    technologies ("Mango" into MongoDB, "Sprint" into Spring). Typos are
+    corrected later by the tech stack normalizer, once the text is known to
+    be a tech stack.
+
+    Args:
+        segment: One comma-delimited part of the message
+
+    Returns:
+        True if the segment is made up of technologies only
+    """
+    tokens = [token for token in TECH_TOKEN_SPLIT_PATTERN.split(segment.lower()) if token]
+    return bool(tokens) and all(normalize_tech_name(token) is not None for token in tokens)
+
+
+def _is_position_segment(segment: str) -> bool:
+    """
+    Check whether a segment mentions a job-role keyword.
+
+    Args:
+        segment: One comma-delimited part of the message
+
+    Returns:
+        True if the segment looks like a desired position
+    """
+    tokens = segment.lower().split()
+    return any(token in POSITION_KEYWORDS for token in tokens)
+
+
+def _classify_segment(segment: str) -> str:
+    """
+    Identify which candidate field a message segment confidently belongs to.
+
+    Args:
+        segment: One comma-delimited part of the message
+
+    Returns:
+        Field name, or an empty string if the segment is ambiguous
+    """
+    if EMAIL_SEARCH_PATTERN.fullmatch(segment) and validate_email(segment):
+        return 'email'
+
+    if PHONE_SEARCH_PATTERN.fullmatch(segment) and validate_phone(segment):
+        return 'phone'
+
+    experience_match = EXPERIENCE_SEARCH_PATTERN.match(segment)
+    if experience_match and validate_experience(experience_match.group(1)):
+        return 'experience'
+
+    if _is_tech_segment(segment):
+        return 'tech_stack'
+
+    if _is_position_segment(segment):
+        return 'position'
+
+    return ''
+
+
+def may_contain_several_fields(message: str) -> bool:
+    """
+    Cheap pre-check for extract_candidate_fields: a message without separators
+    is a single segment and can never be a multi-field answer.
+
+    Args:
+        message: Sanitized user message
+
+    Returns:
+        True if the message has more than one segment
+    """
+    return SEGMENT_SPLIT_PATTERN.search(message) is not None
+
+
+def extract_candidate_fields(message: str, missing_fields: Iterable[str]) -> Dict:
+    """
+    Extract every candidate field that can be confidently identified in a message.
+
+    The message is split on commas, semicolons and newlines. Segments matching
+    the email, phone and experience patterns or made up of known technologies
+    are assigned directly. Only when at least two fields are identified this
+    way, and at least one segment matches the email, phone or experience
+    pattern, is the message treated as a multi-field answer. The remaining
+    segments can only be matched to free-text fields by position, so they are
+    assigned in order only when there is exactly one per free-text field still
+    missing (a full paste); otherwise those fields are left for the flow to ask.
+    Position keywords and technology names alone are too weak a signal: an
+    answer such as "Backend Developer, Python" to the position question must
+    not fill the tech stack.
+
+    Args:
+        message: Sanitized user message
+        missing_fields: Field names that have not been collected yet, in flow order
+
+    Returns:
+        Dictionary of field name to value; empty if the message is a single answer
+
+    Examples:
+        >>> extract_candidate_fields(
+        ...     "John Doe, john@x.com, +1 555 123 4567, 5 years, backend, Berlin, Python Go",
+        ...     ['full_name', 'email', 'phone', 'experience', 'position', 'location', 'tech_stack'])['tech_stack']
+        'Python, Go'
+    """
+    missing = list(missing_fields)
+    segments = [segment.strip() for segment in SEGMENT_SPLIT_PATTERN.split(message)]
+    segments = [segment for segment in segments if segment]
+
+    extracted = {}
+    tech_segments: List[str] = []
+    leftovers: List[str] = []
+    hard_matches = 0
+
+    for segment in segments:
+        field = _classify_segment(segment)
+        if field in HARD_PATTERN_FIELDS:
+            hard_matches += 1
+        if field == 'tech_stack':
+            tech_segments.append(segment)
+        elif field and field in missing and field not in extracted:
+            extracted[field] = segment
+        else:
+            leftovers.append(segment)
+
+    if tech_segments and 'tech_stack' in missing:
+        technologies = []
+        for segment in tech_segments:
+            technologies.extend(token for token in TECH_TOKEN_SPLIT_PATTERN.split(segment) if token)
+        extracted['tech_stack'] = ', '.join(technologies)
+
+    if not hard_matches or len(extracted) < MIN_CONFIDENT_FIELDS:
+        return {}
+
+    open_fields = [field for field in missing if field in FREE_TEXT_FIELDS and field not in extracted]
+    if len(open_fields) == len(leftovers):
+        extracted.update(zip(open_fields, leftovers))
+
+    return extracted
+
@@ -0,0 +1,170 @@
+"""
+TalentScout Hiring Assistant - Bounded Chat History
+This module keeps the chat transcript of a session within a fixed memory budget.
+
+NOTE: History is held in-memory only (Streamlit session_state).
+Archived turns are compressed in memory and never written to disk.
+"""
+
+import json
+import zlib
+from collections import deque
+from typing import Dict, Iterator, List
+
+MAX_RECENT_MESSAGES = 40
+ARCHIVE_BLOCK_SIZE = 10
+MAX_SESSION_BYTES = 256 * 1024
+MESSAGE_BYTES_SHARE = 4
+TRUNCATION_MARKER = "\n\n[message truncated]"
+
+
+def _content_bytes(message: Dict) -> int:
+    """
+    Size of a message's content in UTF-8 bytes.
+
+    Args:
+        message: Dictionary with a 'content' key
+
+    Returns:
+        Encoded content length
+    """
+    return len(message.get('content', '').encode('utf-8'))
+
+
+class ChatHistory:
+    """
+    Chat transcript with a ring buffer of recent messages and a compressed archive.
+
+    Recent messages are kept as plain dicts for rendering on every rerun. Messages
+    pushed out of the ring buffer are grouped into blocks and zlib-compressed; the
+    archive is only inflated when earlier messages are explicitly requested. When
+    the session exceeds its memory cap the oldest archive blocks are discarded;
+    if that is not enough, pending and then the oldest recent messages are
+    compressed early so they can be discarded too. A single message is limited
+    to a quarter of the cap and truncated beyond that.
+    """
+
+    def __init__(self, max_recent: int = MAX_RECENT_MESSAGES,
+                 block_size: int = ARCHIVE_BLOCK_SIZE,
+                 max_bytes: int = MAX_SESSION_BYTES):
+        """
+        Initialize an empty chat history.
+
+        Args:
+            max_recent: Number of most recent messages kept uncompressed
+            block_size: Number of evicted messages compressed together
+            max_bytes: Memory cap for the whole session history
+        """
+        self.max_recent = max_recent
+        self.block_size = block_size
+        self.max_bytes = max_bytes
+
+        self._recent = deque()
+        self._pending: List[Dict] = []
+        self._archive = deque()
+        self._archive_bytes = 0
+        self._plain_bytes = 0
+        self._archived_count = 0
+        self.dropped_count = 0
+
+    def append(self, message: Dict):
+        """
+        Add a message, evicting the oldest recent message into the archive if needed.
+
+        Args:
+            message: Dictionary with 'role' and 'content' keys
+        """
+        message = self._truncate(message)
+        self._recent.append(message)
+        self._plain_bytes += _content_bytes(message)
+
+        if len(self._recent) > self.max_recent:
+            self._pending.append(self._recent.popleft())
+
+            if len(self._pending) >= self.block_size:
+                self._compress_pending()
+
+        self._enforce_cap()
+
+    def _truncate(self, message: Dict) -> Dict:
+        """
+        Limit a single message's content to its share of the memory cap.
+
+        Args:
+            message: Dictionary with 'role' and 'content' keys
+
+        Returns:
+            The message, or a truncated copy if its content is too large
+        """
+        limit = self.max_bytes // MESSAGE_BYTES_SHARE
+        if _content_bytes(message) <= limit:
+            return message
+        encoded = message.get('content', '').encode('utf-8')
+        keep = max(0, limit - len(TRUNCATION_MARKER.encode('utf-8')))
+        # Cutting may split a multi-byte character; drop the partial tail.
+        content = encoded[:keep].decode('utf-8', errors='ignore')
+        return dict(message, content=content + TRUNCATION_MARKER)
+
+    def _enforce_cap(self):
+        """
+        Discard the oldest messages until the session fits its memory cap.
+        The newest message is always kept.
+        """
+        while self.memory_bytes() > self.max_bytes:
+            if self._archive:
+                dropped_block, dropped_messages = self._archive.popleft()
+                self._archive_bytes -= len(dropped_block)
+                self._archived_count -= dropped_messages
+                self.dropped_count += dropped_messages
+            elif self._pending:
+                self._compress_pending()
+            elif len(self._recent) > 1:
+                self._pending.append(self._recent.popleft())
+            else:
+                break
+
+    def _compress_pending(self):
+        """
+        Compress pending evicted messages into an archive block.
+        """
+        block = zlib.compress(json.dumps(self._pending).encode('utf-8'))
+        self._archive.append((block, len(self._pending)))
+        self._archive_bytes += len(block)
+        self._archived_count += len(self._pending)
+        self._plain_bytes -= sum(_content_bytes(m) for m in self._pending)
+        self._pending = []
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self._recent)
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    @property
+    def earlier_count(self) -> int:
+        """
+        Number of messages available through earlier_messages().
+        """
+        return self._archived_count + len(self._pending)
+
+    def earlier_messages(self) -> List[Dict]:
+        """
+        Inflate archived messages on demand, oldest first.
+
+        Returns:
+            List of messages no longer held in the ring buffer
+        """
+        messages = []
+        for block, _ in self._archive:
+            messages.extend(json.loads(zlib.decompress(block).decode('utf-8')))
+        messages.extend(self._pending)
+        return messages
+
+    def memory_bytes(self) -> int:
+        """
+        Approximate memory used by message content and compressed blocks.
+
+        Returns:
+            Size in bytes
+        """
+        return self._plain_bytes + self._archive_bytes
@@ -0,0 +1,279 @@
+"""
+TalentScout Hiring Assistant - Latency-Budgeted Generation
+This module sizes question generation requests so the end of a screening
+stays within a latency target, using backend latency observed at runtime.
+"""
+
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+DEFAULT_TARGET_SECONDS = 8.0
+DEFAULT_OVERHEAD_SECONDS = 1.0
+DEFAULT_SECONDS_PER_TOKEN = 0.01
+
+MAX_QUESTIONS_PER_TECHNOLOGY = 5
+MIN_QUESTIONS_PER_TECHNOLOGY = 2
+TOKENS_PER_QUESTION = 35
+TOKENS_PER_HEADING = 8
+TOKEN_CAP_HEADROOM = 1.25
+TOKENS_PER_QUESTION_SMOOTHING = 0.2
+
+OBSERVATION_WINDOW = 50
+
+
+class LatencyModel:
+    """
+    Estimates backend latency as a fixed overhead plus a cost per output token.
+
+    Both terms are fitted by least squares over a sliding window of recent calls;
+    until enough varied observations exist, the configured priors are used.
+    """
+
+    def __init__(self, overhead: float = DEFAULT_OVERHEAD_SECONDS,
+                 seconds_per_token: float = DEFAULT_SECONDS_PER_TOKEN,
+                 window: int = OBSERVATION_WINDOW):
+        """
+        Initialize the latency model.
+
+        Args:
+            overhead: Prior for the fixed per-call latency in seconds
+            seconds_per_token: Prior for latency per output token in seconds
+            window: Number of recent observations used for fitting
+        """
+        self.overhead = overhead
+        self.seconds_per_token = seconds_per_token
+        self._observations = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, output_tokens: int):
+        """
+        Record one backend call and refit the model.
+
+        Args:
+            seconds: Observed wall-clock latency of the call
+            output_tokens: Number of tokens in the response
+        """
+        with self._lock:
+            self._observations.append((output_tokens, seconds))
+            self._fit()
+
+    def _fit(self):
+        """
+        Refit overhead and per-token cost from the observation window.
+        """
+        n = len(self._observations)
+        if n == 0:
+            return
+
+        mean_tokens = sum(t for t, _ in self._observations) / n
+        mean_seconds = sum(s for _, s in self._observations) / n
+        variance = sum((t - mean_tokens) ** 2 for t, _ in self._observations)
+
+        if n >= 3 and variance > 0:
+            covariance = sum((t - mean_tokens) * (s - mean_seconds) for t, s in self._observations)
+            slope = covariance / variance
+            if slope > 0:
+                self.seconds_per_token = slope
+                self.overhead = max(0.0, mean_seconds - slope * mean_tokens)
+                return
+
+        self.seconds_per_token = max(0.0, (mean_seconds - self.overhead) / max(mean_tokens, 1))
+
+    def predict(self, output_tokens: int) -> float:
+        """
+        Predict the latency of a call producing a given number of tokens.
+
+        Args:
+            output_tokens: Expected output tokens
+
+        Returns:
+            Predicted latency in seconds
+        """
+        return self.overhead + self.seconds_per_token * output_tokens
+
+    def token_budget(self, seconds: float) -> int:
+        """
+        Get the largest output size expected to finish within a time budget.
+
+        Args:
+            seconds: Available time in seconds
+
+        Returns:
+            Number of output tokens, 0 if the budget does not cover the overhead
+        """
+        if self.seconds_per_token <= 0:
+            return 10 ** 6
+        return max(0, int((seconds - self.overhead) / self.seconds_per_token))
+
+
+class GenerationPlan:
+    """
+    Decision for one generation request.
+    """
+
+    def __init__(self, technologies: List[str], questions_per_technology: int,
+                 max_output_tokens: int, predicted_seconds: float, dropped: List[str]):
+        self.technologies = technologies
+        self.questions_per_technology = questions_per_technology
+        self.max_output_tokens = max_output_tokens
+        self.predicted_seconds = predicted_seconds
+        self.dropped = dropped
+
+    def as_dict(self) -> Dict:
+        """
+        Get the plan as a dictionary for metrics.
+
+        Returns:
+            Dictionary of plan fields
+        """
+        return {
+            'technologies': self.technologies,
+            'questions_per_technology': self.questions_per_technology,
+            'max_output_tokens': self.max_output_tokens,
+            'predicted_seconds': self.predicted_seconds,
+            'dropped': self.dropped,
+        }
+
+    def restricted_to(self, technologies: List[str]) -> 'GenerationPlan':
+        """
+        Derive the plan for generating a subset of the planned technologies,
+        scaling the token cap and predicted latency by the subset's share.
+
+        Args:
+            technologies: Technologies still to be generated
+
+        Returns:
+            GenerationPlan covering only the given technologies
+        """
+        share = len(technologies) / max(len(self.technologies), 1)
+        return GenerationPlan(
+            technologies=list(technologies),
+            questions_per_technology=self.questions_per_technology,
+            max_output_tokens=max(1, int(self.max_output_tokens * share)),
+            predicted_seconds=self.predicted_seconds * share,
+            dropped=[],
+        )
+
+
+def expected_tokens(technology_count: int, questions_per_technology: int,
+                    tokens_per_question: float = TOKENS_PER_QUESTION) -> int:
+    """
+    Estimate output tokens for a question set.
+
+    Args:
+        technology_count: Number of technologies
+        questions_per_technology: Questions generated per technology
+        tokens_per_question: Average tokens per generated question
+
+    Returns:
+        Estimated output tokens
+    """
+    return int(technology_count * (TOKENS_PER_HEADING + questions_per_technology * tokens_per_question))
+
+
+class SLOController:
+    """
+    Chooses questions per technology, which technologies to cover and an
+    output token cap so the predicted generation latency meets the target.
+
+    Technologies are kept in the order the candidate listed them; when even the
+    minimum number of questions does not fit, the last-listed ones are dropped.
+    At least one technology is always kept.
+    """
+
+    def __init__(self, target_seconds: float = DEFAULT_TARGET_SECONDS,
+                 model: Optional[LatencyModel] = None):
+        """
+        Initialize the controller.
+
+        Args:
+            target_seconds: Latency target for question generation
+            model: Latency model; a model with default priors is created if omitted
+        """
+        self.target_seconds = target_seconds
+        self.model = model or LatencyModel()
+        self.tokens_per_question = float(TOKENS_PER_QUESTION)
+        self._lock = threading.Lock()
+        self.decisions = 0
+        self.dropped_technologies = 0
+        self.questions_histogram: Dict[int, int] = {}
+        self.last_plan: Optional[GenerationPlan] = None
+
+    def plan(self, technologies: List[str]) -> GenerationPlan:
+        """
+        Decide how to generate questions for a tech stack.
+
+        Args:
+            technologies: Candidate's technologies in listed order
+
+        Returns:
+            GenerationPlan for the request
+        """
+        budget = self.model.token_budget(self.target_seconds)
+        per_question = self.tokens_per_question
+        kept = list(technologies)
+        questions = MIN_QUESTIONS_PER_TECHNOLOGY
+
+        for count in range(MAX_QUESTIONS_PER_TECHNOLOGY, MIN_QUESTIONS_PER_TECHNOLOGY - 1, -1):
+            questions = count
+            if expected_tokens(len(kept), count, per_question) <= budget:
+                break
+
+        while len(kept) > 1 and expected_tokens(len(kept), questions, per_question) > budget:
+            kept.pop()
+
+        tokens = expected_tokens(len(kept), questions, per_question)
+        plan = GenerationPlan(
+            technologies=kept,
+            questions_per_technology=questions,
+            max_output_tokens=int(tokens * TOKEN_CAP_HEADROOM),
+            predicted_seconds=self.model.predict(tokens),
+            dropped=list(technologies[len(kept):]),
+        )
+
+        with self._lock:
+            self.decisions += 1
+            self.dropped_technologies += len(plan.dropped)
+            self.questions_histogram[questions] = self.questions_histogram.get(questions, 0) + 1
+            self.last_plan = plan
+
+        return plan
+
+    def observe(self, seconds: float, output_tokens: int, plan: Optional[GenerationPlan] = None):
+        """
+        Feed an observed backend call back into the latency model, and into the
+        tokens-per-question estimate when the plan that produced it is given.
+
+        Args:
+            seconds: Observed latency
+            output_tokens: Tokens in the response
+            plan: Plan the request was made with
+        """
+        self.model.observe(seconds, output_tokens)
+
+        if plan is not None and plan.technologies:
+            question_count = len(plan.technologies) * plan.questions_per_technology
+            observed = (output_tokens - len(plan.technologies) * TOKENS_PER_HEADING) / question_count
+            with self._lock:
+                self.tokens_per_question += TOKENS_PER_QUESTION_SMOOTHING * (
+                    max(1.0, observed) - self.tokens_per_question)
+
+    def stats(self) -> Dict:
+        """
+        Get controller decisions and latency model estimates.
+
+        Returns:
+            Dictionary of metrics
+        """
+        with self._lock:
+            return {
+                'target_seconds': self.target_seconds,
+                'decisions': self.decisions,
+                'dropped_technologies': self.dropped_technologies,
+                'questions_histogram': dict(self.questions_histogram),
+                'overhead_seconds': self.model.overhead,
+                'seconds_per_token': self.model.seconds_per_token,
+                'tokens_per_question': self.tokens_per_question,
+                'last_plan': self.last_plan.as_dict() if self.last_plan else None,
+            }
@@ -0,0 +1,144 @@
+"""
+TalentScout Hiring Assistant - Opt-In Profiling
+This module captures cProfile statistics and tracemalloc snapshots for
+individual sessions, to diagnose slow screenings or memory spikes.
+
+Profiling is off unless PROFILING=1 is set, or it is switched on from the
+sidebar toggle that operators expose with PROFILING_ALLOW_TOGGLE=1.
+PROFILING_SAMPLE_RATE (0.0-1.0) profiles only a fraction of sessions
+and PROFILING_DIR sets the output directory. Output files contain function
+timings and allocation sites only, never candidate data.
+"""
+
+import cProfile
+import os
+import random
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+DEFAULT_PROFILE_DIR = 'profiles'
+
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+
+
+def _start_tracing():
+    """
+    Start tracemalloc, reference-counted across concurrently profiled sessions.
+    """
+    global _tracing_users
+    with _tracing_lock:
+        if _tracing_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _tracing_users += 1
+
+
+def _stop_tracing():
+    """
+    Stop tracemalloc once the last profiled session has finished its capture.
+    """
+    global _tracing_users
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+class SessionProfiler:
+    """
+    Writes a .pstats file and a .tracemalloc snapshot for each captured block.
+
+    Captures are not nested: a capture started inside another one is a no-op,
+    since the outer profile already includes it. If profiling cannot start
+    (e.g. another session's profiler is active, which Python 3.12+ rejects),
+    the block runs unprofiled and the capture is counted as skipped.
+    """
+
+    def __init__(self, output_dir: str = DEFAULT_PROFILE_DIR, session_id: Optional[str] = None):
+        """
+        Initialize a profiler for one session.
+
+        Args:
+            output_dir: Directory receiving profile files
+            session_id: Identifier used in file names; random if omitted
+        """
+        self.output_dir = output_dir
+        self.session_id = session_id or uuid.uuid4().hex[:12]
+        self.captures: List[Dict] = []
+        self.skipped = 0
+        self._active = False
+
+    @contextmanager
+    def capture(self, label: str):
+        """
+        Profile the enclosed block and write its statistics to disk.
+
+        Args:
+            label: Name of the profiled operation, used in file names
+        """
+        if self._active:
+            yield
+            return
+
+        self._active = True
+        tracing = False
+        try:
+            os.makedirs(self.output_dir, exist_ok=True)
+            _start_tracing()
+            tracing = True
+            tracemalloc.reset_peak()
+            profile = cProfile.Profile()
+            profile.enable()
+        except (OSError, ValueError) as e:
+            if tracing:
+                _stop_tracing()
+            self._active = False
+            self.skipped += 1
+            print(f"Profiling skipped for {label}: {str(e)}")
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            profile.disable()
+            try:
+                elapsed = time.perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+                snapshot = tracemalloc.take_snapshot()
+            finally:
+                _stop_tracing()
+                self._active = False
+
+            base = os.path.join(self.output_dir, f"{self.session_id}-{len(self.captures) + 1:04d}-{label}")
+            profile.dump_stats(base + '.pstats')
+            snapshot.dump(base + '.tracemalloc')
+
+            self.captures.append({
+                'label': label,
+                'path': base,
+                'seconds': elapsed,
+                'peak_bytes': peak,
+            })
+
+
+def profiler_from_env() -> Optional[SessionProfiler]:
+    """
+    Create a profiler for a new session if profiling is enabled and the session is sampled.
+
+    Returns:
+        SessionProfiler instance, or None if this session is not profiled
+    """
+    if os.getenv('PROFILING') != '1':
+        return None
+
+    sample_rate = float(os.getenv('PROFILING_SAMPLE_RATE', '1.0'))
+    if random.random() >= sample_rate:
+        return None
+
+    return SessionProfiler(os.getenv('PROFILING_DIR', DEFAULT_PROFILE_DIR))
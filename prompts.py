@@ -19,7 +19,7 @@ If the user's response is unclear, politely ask them to clarify."""
 TECHNICAL_QUESTION_GENERATION_PROMPT = """Generate technical interview questions based on the provided tech stack: {tech_stack}
 
 Rules:
-- Generate EXACTLY 3-5 questions per technology
+- Generate EXACTLY {questions_per_technology} questions per technology
 - Do NOT include answers or solutions
 - Questions must range from basic to intermediate difficulty
 - Include at least one scenario-based or practical question per technology
@@ -40,6 +40,31 @@ Output format:
 ...
 """
 
+DEFAULT_QUESTIONS_PER_TECHNOLOGY = "3-5"
+
+ANSWER_KEYWORDS_INSTRUCTION = """
+Directly below each question, add one line listing the concepts a good answer should mention:
+   Keywords: [3-6 expected concepts, one to three words each, comma-separated]
+"""
+
+BATCHED_QUESTION_GENERATION_PROMPT = """Generate technical interview questions separately for each candidate listed below.
+Apply the following instructions to every candidate independently, using that candidate's tech stack:
+
+{instructions}
+
+Candidates:
+{sections}
+
+Output rules for the batch:
+- Begin each candidate's questions with a line containing only its marker, e.g. === CANDIDATE 1 ===
+- Output the candidates in the order given, one section per candidate
+- Do NOT mix questions between candidates
+"""
+
+BATCH_SECTION_TEMPLATE = "[CANDIDATE {index}] tech stack: {tech_stack}"
+
+BATCH_OUTPUT_MARKER = "=== CANDIDATE {index} ==="
+
 FALLBACK_PROMPT = """The user provided an unclear or unexpected response during candidate screening.
 Context: {context}
 User input: {user_input}
@@ -52,12 +77,31 @@ I'll collect a few basic details and ask some technical questions to understand
 
 EXIT_MESSAGE = """Thank you for your time. Our recruitment team will reach out if there's a suitable match."""
 
+INFO_COMPLETE_MESSAGE = """Great! I have all the information I need. Let me generate some technical questions based on your tech stack..."""
+
+UNCLEAR_INPUT_MESSAGE = """I didn't quite understand that. Could you please rephrase?"""
+
+RETURNING_CANDIDATE_MESSAGE = """Welcome back, {name}! You completed a screening with us recently, so there's no need to start over. Here is where you left off:"""
+
+ANSWER_COLLECTION_INTRO = """Let's go through them one at a time. Please answer each question in your own words."""
+
+ANSWER_QUESTION_TEMPLATE = """**Question {number} of {total}** ({technology}): {question}"""
+
+ANSWERS_COMPLETE_MESSAGE = """Thank you for answering all the questions! Our recruitment team will review your answers and reach out if there's a suitable match."""
+
 CANDIDATE_INFO_FIELDS = [
     {"field": "full_name", "prompt": "Could you please provide your full name?"},
-    {"field": "email", "prompt": "What is your email address?"},
-    {"field": "phone", "prompt": "What is your phone number?"},
-    {"field": "experience", "prompt": "How many years of professional experience do you have?"},
+    {"field": "email", "prompt": "What is your email address?",
+     "validator": "email",
+     "error": "That doesn't appear to be a valid email address. Could you please provide a valid email?"},
+    {"field": "phone", "prompt": "What is your phone number?",
+     "validator": "phone",
+     "error": "That doesn't appear to be a valid phone number. Could you please provide a valid phone number?"},
+    {"field": "experience", "prompt": "How many years of professional experience do you have?",
+     "validator": "experience",
+     "error": "Please provide a valid number of years of experience (e.g., '5' or '2.5 years')."},
     {"field": "position", "prompt": "What position(s) are you interested in?"},
     {"field": "location", "prompt": "What is your current location?"},
-    {"field": "tech_stack", "prompt": "What technologies are you proficient in? (Please list your tech stack)"}
+    {"field": "tech_stack", "prompt": "What technologies are you proficient in? (Please list your tech stack)",
+     "normalizer": "tech_stack"}
 ]
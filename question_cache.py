@@ -0,0 +1,271 @@
+"""
+TalentScout Hiring Assistant - Question Cache
+This module caches generated technical questions per normalized tech stack.
+In similarity mode, cached question sets are also split into per-technology
+blocks so overlapping stacks only generate the technologies not yet covered.
+
+NOTE: The cache is in-memory only and holds generated questions, never
+candidate details. It is shared by all sessions of the process.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from utils import tech_stack_key
+
+DEFAULT_MAX_ENTRIES = 512
+
+HEADING_PATTERN = re.compile(r'^\s*\*\*(.+?)\*\*\s*$', re.MULTILINE)
+
+
+class QuestionCache:
+    """
+    Thread-safe LRU cache of question text keyed by normalized request key.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Number of entries kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """
+        Look up cached questions.
+
+        Args:
+            key: Normalized request key
+
+        Returns:
+            Cached question text, or None on a miss
+        """
+        with self._lock:
+            questions = self._entries.get(key)
+            if questions is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return questions
+
+    def put(self, key: Hashable, questions: str):
+        """
+        Store generated questions.
+
+        Args:
+            key: Normalized request key
+            questions: Generated question text
+        """
+        with self._lock:
+            self._entries[key] = questions
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self.evictions += 1
+                self._on_evict(evicted)
+
+    def _on_evict(self, key: Hashable):
+        """
+        Hook called with the lock held when an entry is evicted.
+
+        Args:
+            key: Evicted key
+        """
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict:
+        """
+        Get cache counters.
+
+        Returns:
+            Dictionary with size, hits, misses, evictions and hit rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+            }
+
+
+def technology_key(name: str) -> str:
+    """
+    Get the canonical lowercase key of a single technology.
+
+    Args:
+        name: Technology name or alias
+
+    Returns:
+        Key as used in tech stack keys, empty if the name is blank
+    """
+    key = tech_stack_key([name])
+    return key[0] if key else ''
+
+
+def split_technology_blocks(text: str) -> List[Tuple[str, str]]:
+    """
+    Split generated questions into blocks, one per technology heading.
+
+    Args:
+        text: Question text in the format requested by the generation prompt
+
+    Returns:
+        List of (heading, block text including the heading) in output order
+    """
+    headings = list(HEADING_PATTERN.finditer(text))
+    blocks = []
+    for i, heading in enumerate(headings):
+        end = headings[i + 1].start() if i + 1 < len(headings) else len(text)
+        blocks.append((heading.group(1).strip(), text[heading.start():end].strip()))
+    return blocks
+
+
+def jaccard(a, b) -> float:
+    """
+    Jaccard similarity of two collections.
+
+    Args:
+        a: First collection
+        b: Second collection
+
+    Returns:
+        Size of the intersection over size of the union, 0 for two empty collections
+    """
+    a, b = set(a), set(b)
+    union = len(a | b)
+    return len(a & b) / union if union else 0.0
+
+
+class SimilarityQuestionCache(QuestionCache):
+    """
+    Question cache that also serves overlapping tech stacks from cached
+    per-technology blocks.
+
+    Keys are (tech stack key, *variant) tuples as built by HiringAssistant;
+    blocks are only reused between keys with the same variant (question count
+    and keyword mode). An inverted index maps each (variant, technology) to the
+    entries holding a block for it.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Number of entries kept before the least recently used is evicted
+        """
+        super().__init__(max_entries)
+        self._blocks: Dict[Hashable, Dict[str, str]] = {}
+        self._index: Dict[Tuple, set] = {}
+        self.partial_hits = 0
+        self.blocks_served = 0
+        self.uncovered_technologies = 0
+
+    def put(self, key: Hashable, questions: str):
+        """
+        Store generated questions and index their per-technology blocks.
+
+        Args:
+            key: (tech stack key, *variant) tuple
+            questions: Generated question text
+        """
+        stack = set(key[0])
+        blocks = {}
+        for heading, block in split_technology_blocks(questions):
+            technology = technology_key(heading)
+            if technology in stack:
+                blocks.setdefault(technology, block)
+
+        with self._lock:
+            self._unindex(key)
+            self._blocks[key] = blocks
+            for technology in blocks:
+                self._index.setdefault((key[1:], technology), set()).add(key)
+            super().put(key, questions)
+
+    def _on_evict(self, key: Hashable):
+        self._unindex(key)
+
+    def _unindex(self, key: Hashable):
+        """
+        Remove an entry's blocks from the inverted index.
+
+        Args:
+            key: Entry key
+        """
+        for technology in self._blocks.pop(key, {}):
+            keys = self._index.get((key[1:], technology))
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._index[(key[1:], technology)]
+
+    def cover(self, key: Hashable) -> Tuple[Dict[str, str], List[str]]:
+        """
+        Find cached blocks for as many technologies of a stack as possible.
+        Entries are tried in order of Jaccard similarity to the requested stack,
+        so blocks come from the most similar cached stacks.
+
+        Args:
+            key: (tech stack key, *variant) tuple of the request
+
+        Returns:
+            Tuple of (technology key to block text, technology keys not covered)
+        """
+        stack = key[0]
+        variant = key[1:]
+
+        with self._lock:
+            candidates = set()
+            for technology in stack:
+                candidates |= self._index.get((variant, technology), set())
+
+            covered = {}
+            for candidate in sorted(candidates, key=lambda k: (-jaccard(stack, k[0]), k[0])):
+                for technology, block in self._blocks[candidate].items():
+                    if technology in stack and technology not in covered:
+                        covered[technology] = block
+                self._entries.move_to_end(candidate)
+                if len(covered) == len(stack):
+                    break
+
+            missing = [technology for technology in stack if technology not in covered]
+            if covered:
+                self.partial_hits += 1
+                self.blocks_served += len(covered)
+                self.uncovered_technologies += len(missing)
+
+        return covered, missing
+
+    def stats(self) -> Dict:
+        """
+        Get cache counters, including partial hits served from technology blocks.
+
+        Returns:
+            Dictionary with size, hits, misses, evictions, hit rates and block counts
+        """
+        with self._lock:
+            stats = super().stats()
+            stats.update({
+                'partial_hits': self.partial_hits,
+                'partial_hit_rate': self.partial_hits / self.misses if self.misses else 0.0,
+                'blocks_served': self.blocks_served,
+                'uncovered_technologies': self.uncovered_technologies,
+                'indexed_technologies': len(self._index),
+            })
+            return stats
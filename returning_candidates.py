@@ -0,0 +1,168 @@
+"""
+TalentScout Hiring Assistant - Returning Candidate Index
+This module remembers recently completed screenings so a candidate who reloads
+the page or resets the conversation is resumed instead of screened again.
+
+NOTE: The index is in-memory only and never written to disk. Candidates are
+identified by keyed hashes of their email and phone number, using a random
+salt generated per process, and entries expire after a short TTL. Only the
+final response (the generated questions) is kept, never the candidate's
+details or answers.
+"""
+
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from utils import PHONE_STRIP_PATTERN
+
+DEFAULT_TTL_SECONDS = 1800
+DEFAULT_MAX_ENTRIES = 1000
+
+
+class ReturningCandidateIndex:
+    """
+    Thread-safe, size-bounded TTL index from hashed contact details to the
+    final response of the candidate's last completed screening. Entries are
+    kept in completion order; when full, the oldest completion is evicted
+    first (FIFO), and lookups do not change the order.
+
+    A candidate is only resumed when both the email and the phone number match
+    the same entry, so knowing one identifier is not enough to retrieve
+    another candidate's details.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize an empty index.
+
+        Args:
+            ttl_seconds: Seconds an entry stays available after the screening completed
+            max_entries: Number of candidates kept before the oldest completion is evicted
+            clock: Monotonic time source, injectable for tests
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._salt = secrets.token_bytes(16)
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+
+    def _identity(self, email: str, phone: str) -> str:
+        """
+        Hash normalized contact details with the process salt.
+
+        Args:
+            email: Email address
+            phone: Phone number
+
+        Returns:
+            Hex digest identifying the candidate
+        """
+        normalized = f"{email.strip().lower()}|{PHONE_STRIP_PATTERN.sub('', phone)}"
+        return hmac.new(self._salt, normalized.encode('utf-8'), hashlib.sha256).hexdigest()
+
+    def _expire(self, now: float):
+        """
+        Drop expired entries. Entries are kept in completion order, so only the
+        oldest need checking.
+
+        Args:
+            now: Current clock reading
+        """
+        while self._entries:
+            identity, entry = next(iter(self._entries.items()))
+            if entry['expires_at'] > now:
+                break
+            del self._entries[identity]
+            self.expirations += 1
+
+    def remember(self, email: str, phone: str, response: str):
+        """
+        Store the final response of a completed screening.
+
+        Args:
+            email: Candidate email
+            phone: Candidate phone number
+            response: Final response shown to the candidate (the generated questions)
+        """
+        identity = self._identity(email, phone)
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            self._entries.pop(identity, None)
+            self._entries[identity] = {
+                'response': response,
+                'expires_at': now + self.ttl_seconds,
+            }
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def lookup(self, email: str, phone: str) -> Optional[str]:
+        """
+        Find the last completed screening of a returning candidate.
+
+        Args:
+            email: Candidate email
+            phone: Candidate phone number
+
+        Returns:
+            Final response of that screening, or None
+        """
+        identity = self._identity(email, phone)
+        with self._lock:
+            self._expire(self._clock())
+            entry = self._entries.get(identity)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry['response']
+
+    def forget(self, email: str, phone: str) -> bool:
+        """
+        Remove a candidate from the index.
+
+        Args:
+            email: Candidate email
+            phone: Candidate phone number
+
+        Returns:
+            True if an entry was removed
+        """
+        identity = self._identity(email, phone)
+        with self._lock:
+            return self._entries.pop(identity, None) is not None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict:
+        """
+        Get index counters.
+
+        Returns:
+            Dictionary with size, hits, misses, expirations and evictions
+        """
+        with self._lock:
+            self._expire(self._clock())
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'expirations': self.expirations,
+                'evictions': self.evictions,
+                'ttl_seconds': self.ttl_seconds,
+                'max_entries': self.max_entries,
+            }
@@ -0,0 +1,159 @@
+"""
+TalentScout - Simulated Candidate Harness
+Runs scripted candidates through the HiringAssistant with a stub backend and
+reports conversation turns and Streamlit reruns per screening.
+
+Set LLM_CASSETTE_REPLAY to a recorded cassette to replay real Gemini output
+sizes and latencies instead of the stub (LLM_CASSETTE_TIME_SCALE scales delays).
+
+Run with: python simulate_candidates.py
+"""
+
+import os
+import time
+
+from chatbot import HiringAssistant
+from backends import StubBackend, ReplayBackend
+from prompts import CANDIDATE_INFO_FIELDS
+
+CANDIDATE_PROFILES = [
+    {
+        "full_name": "John Doe",
+        "email": "john@example.com",
+        "phone": "+1 555 123 4567",
+        "experience": "5 years",
+        "position": "Backend Developer",
+        "location": "Berlin",
+        "tech_stack": "Python Go",
+    },
+    {
+        "full_name": "Priya Sharma",
+        "email": "priya.sharma@example.com",
+        "phone": "+91 98765 43210",
+        "experience": "3 yrs",
+        "position": "Frontend Engineer",
+        "location": "Bangalore",
+        "tech_stack": "React TypeScript",
+    },
+    {
+        "full_name": "Maria Garcia",
+        "email": "maria.g@example.com",
+        "phone": "(555) 987-6543",
+        "experience": "8 years",
+        "position": "DevOps Engineer",
+        "location": "Madrid",
+        "tech_stack": "Docker Kubernetes Terraform",
+    },
+]
+
+ANSWER_STYLES = ['stepwise', 'partial', 'paste']
+
+MAX_TURNS = 30
+
+
+def _first_message(profile: dict, style: str) -> str:
+    """
+    Build the candidate's opening message for the given answer style.
+
+    Args:
+        profile: Candidate profile
+        style: 'stepwise', 'partial' or 'paste'
+
+    Returns:
+        Message text
+    """
+    fields = [field_info['field'] for field_info in CANDIDATE_INFO_FIELDS]
+    if style == 'paste':
+        return ', '.join(profile[field] for field in fields)
+    if style == 'partial':
+        return ', '.join(profile[field] for field in fields[:3])
+    return profile[fields[0]]
+
+
+def create_backend():
+    """
+    Create the backend used for simulated screenings.
+
+    Returns:
+        ReplayBackend if LLM_CASSETTE_REPLAY is set, otherwise a StubBackend
+    """
+    replay_path = os.getenv('LLM_CASSETTE_REPLAY')
+    if replay_path:
+        time_scale = float(os.getenv('LLM_CASSETTE_TIME_SCALE', '1.0'))
+        return ReplayBackend(replay_path, time_scale=time_scale, strict=False)
+    return StubBackend()
+
+
+def simulate_screening(profile: dict, style: str, multi_field: bool) -> dict:
+    """
+    Run a single simulated screening to completion.
+
+    Args:
+        profile: Candidate profile
+        style: Answer style of the candidate
+        multi_field: Whether local multi-field extraction is enabled
+
+    Returns:
+        Dictionary with turn and rerun counts, backend calls and screening duration
+    """
+    backend = create_backend()
+    assistant = HiringAssistant(api_key='', model=backend)
+    assistant.multi_field_extraction = multi_field
+
+    message = _first_message(profile, style)
+    turns = 0
+    start = time.perf_counter()
+    should_continue = True
+
+    while should_continue and turns < MAX_TURNS:
+        turns += 1
+        _, should_continue = assistant.process_user_response(message)
+
+        if assistant.current_field_index < len(assistant.flow):
+            message = profile[assistant.flow.states[assistant.current_field_index].field]
+        else:
+            message = "ok"
+
+    return {
+        'turns': turns,
+        'reruns': turns + 1,
+        'backend_calls': backend.calls,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def run_harness() -> dict:
+    """
+    Simulate every profile and answer style with extraction off and on.
+
+    Returns:
+        Dictionary mapping 'single' / 'multi' to average turns and reruns
+    """
+    results = {}
+    for label, multi_field in (('single', False), ('multi', True)):
+        runs = [
+            simulate_screening(profile, style, multi_field)
+            for profile in CANDIDATE_PROFILES
+            for style in ANSWER_STYLES
+        ]
+        results[label] = {
+            'avg_turns': sum(run['turns'] for run in runs) / len(runs),
+            'avg_reruns': sum(run['reruns'] for run in runs) / len(runs),
+            'avg_seconds': sum(run['seconds'] for run in runs) / len(runs),
+        }
+    return results
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("TalentScout - Simulated Candidate Harness")
+    print("=" * 70)
+
+    results = run_harness()
+    for label, stats in results.items():
+        print(f"{label:>8}-field extraction: "
+              f"{stats['avg_turns']:.2f} turns, {stats['avg_reruns']:.2f} reruns, "
+              f"{stats['avg_seconds'] * 1000:.1f} ms per screening")
+
+    reduction = 1 - results['multi']['avg_turns'] / results['single']['avg_turns']
+    print(f"\nTurn reduction: {reduction:.0%}")
@@ -0,0 +1,179 @@
+"""
+TalentScout Hiring Assistant - Typo-Tolerant Technology Matching
+This module corrects misspelled technology names ("Pyhton", "Kubernets") against
+the known-technology vocabulary using a SymSpell-style deletion index.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set
+
+from utils import TECH_ALIASES
+
+DEFAULT_MAX_DISTANCE = 2
+
+
+def max_distance_for(term: str) -> int:
+    """
+    Get the edit distance tolerated for a term of a given length.
+    Short names are matched exactly, since "go" and "js" are one edit from many words.
+
+    Args:
+        term: Lowercase term being looked up
+
+    Returns:
+        Maximum allowed edit distance
+    """
+    if len(term) <= 4:
+        return 0
+    if len(term) <= 8:
+        return 1
+    return 2
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent transpositions).
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Distance above which computation stops early
+
+    Returns:
+        Edit distance, or max_distance + 1 if it exceeds max_distance
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+
+    return previous[len(b)] if previous[len(b)] <= max_distance else max_distance + 1
+
+
+def _deletes(term: str, max_distance: int) -> Set[str]:
+    """
+    Generate every string reachable from term by deleting up to max_distance characters.
+
+    Args:
+        term: Source string
+        max_distance: Maximum number of deletions
+
+    Returns:
+        Set of deletion variants, including term itself
+    """
+    variants = {term}
+    frontier = {term}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for word in frontier:
+            for i in range(len(word)):
+                next_frontier.add(word[:i] + word[i + 1:])
+        variants |= next_frontier
+        frontier = next_frontier
+    return variants
+
+
+class TechMatcher:
+    """
+    Nearest-match lookup over a technology vocabulary.
+
+    Every vocabulary term is indexed under all of its deletion variants up to
+    max_distance. A query's own deletion variants are looked up in that index
+    to gather candidates, which are then verified with the real edit distance,
+    so a lookup costs a few dozen dictionary probes regardless of vocabulary size.
+    """
+
+    def __init__(self, vocabulary: Dict[str, str], max_distance: int = DEFAULT_MAX_DISTANCE):
+        """
+        Build the deletion index.
+
+        Args:
+            vocabulary: Mapping of lowercase term or alias to canonical name
+            max_distance: Largest edit distance the index supports
+        """
+        self.max_distance = max_distance
+        self._canonical = {term.lower(): name for term, name in vocabulary.items()}
+        self._index: Dict[str, List[str]] = {}
+
+        for term in self._canonical:
+            for variant in _deletes(term, max_distance):
+                self._index.setdefault(variant, []).append(term)
+
+    def __len__(self) -> int:
+        return len(self._canonical)
+
+    def lookup(self, term: str, max_distance: Optional[int] = None) -> Optional[str]:
+        """
+        Find the canonical name of the closest vocabulary term.
+
+        Args:
+            term: Technology name as typed
+            max_distance: Allowed edit distance; defaults to a length-based threshold
+
+        Returns:
+            Canonical name, or None if nothing is within the allowed distance
+        """
+        key = term.strip().lower()
+        if key in self._canonical:
+            return self._canonical[key]
+
+        if max_distance is None:
+            max_distance = max_distance_for(key)
+        max_distance = min(max_distance, self.max_distance)
+        if max_distance == 0:
+            return None
+
+        best_term = None
+        best_distance = max_distance + 1
+        seen = set()
+        for variant in _deletes(key, max_distance):
+            for candidate in self._index.get(variant, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                distance = edit_distance(key, candidate, max_distance)
+                if distance > max_distance:
+                    continue
+                if distance < best_distance or (distance == best_distance and candidate < best_term):
+                    best_term = candidate
+                    best_distance = distance
+
+        return self._canonical[best_term] if best_term is not None else None
+
+    def correct(self, technologies: Iterable[str]) -> List[str]:
+        """
+        Replace misspelled technologies with their canonical names.
+        Known names and unrecognized names are kept as typed.
+
+        Args:
+            technologies: Parsed technology names
+
+        Returns:
+            List of technologies with typos corrected
+
+        Examples:
+            >>> TECH_MATCHER.correct(['Pyhton', 'Kubernets', 'Postgress', 'Elixir'])
+            ['Python', 'Kubernetes', 'PostgreSQL', 'Elixir']
+        """
+        corrected = []
+        for tech in technologies:
+            if tech.strip().lower() in self._canonical:
+                corrected.append(tech)
+            else:
+                corrected.append(self.lookup(tech) or tech)
+        return corrected
+
+
+TECH_MATCHER = TechMatcher(TECH_ALIASES)
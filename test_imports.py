@@ -58,6 +58,593 @@ def test_utils():
     print("✓ Exit command detection works")
 
 
+def test_extraction():
+    """Test local multi-field extraction."""
+    print("\nTesting multi-field extraction...")
+
+    from extraction import extract_candidate_fields
+
+    fields = ['full_name', 'email', 'phone', 'experience', 'position', 'location', 'tech_stack']
+
+    extracted = extract_candidate_fields(
+        "John Doe, john@x.com, +1 555 123 4567, 5 years, backend, Berlin, Python Go", fields)
+    assert extracted == {
+        'full_name': 'John Doe',
+        'email': 'john@x.com',
+        'phone': '+1 555 123 4567',
+        'experience': '5 years',
+        'position': 'backend',
+        'location': 'Berlin',
+        'tech_stack': 'Python, Go',
+    }, f"Multi-field extraction failed: {extracted}"
+    print("✓ All fields extracted from a pasted message")
+
+    assert extract_candidate_fields("John Doe", fields) == {}
+    assert extract_candidate_fields("Python, Django, SQL", ['tech_stack']) == {}
+    assert extract_candidate_fields("Backend Developer, Python", ['position', 'location', 'tech_stack']) == {}
+    print("✓ Single answers are left to the one-field flow")
+
+    assert extract_candidate_fields("John Doe, john@x.com, 5 years, Berlin", fields) == {
+        'email': 'john@x.com', 'experience': '5 years'}
+    assert extract_candidate_fields("Just a sec, john@x.com, 5 years", fields) == {
+        'email': 'john@x.com', 'experience': '5 years'}
+    assert extract_candidate_fields("Doe, John, john@x.com, +1 555 123 4567", fields) == {
+        'email': 'john@x.com', 'phone': '+1 555 123 4567'}
+    print("✓ Free-text segments of a partial paste are left for the flow to ask")
+
+    from backends import StubBackend
+    from chatbot import HiringAssistant
+
+    assistant = HiringAssistant(api_key='', model=StubBackend())
+    assistant.current_field_index = assistant.flow.fields.index('position')
+    assistant.process_user_response("Backend Developer, Python")
+    assert assistant.candidate_data == {'position': 'Backend Developer, Python'}
+    assert assistant.flow.fields[assistant.current_field_index] == 'location'
+    print("✓ A position answer naming a technology does not fill the tech stack")
+
+    for word in ["Mango", "Linus", "Sprint", "Rusty"]:
+        extracted = extract_candidate_fields(f"{word}, mango@x.com, 5 years", fields)
+        assert 'tech_stack' not in extracted, f"{word} was taken for a technology: {extracted}"
+    print("✓ Ordinary words are not taken for misspelled technologies")
+
+
+def test_tech_matching():
+    """Test typo-tolerant technology matching."""
+    print("\nTesting technology matching...")
+
+    from tech_matching import TECH_MATCHER
+
+    assert TECH_MATCHER.lookup("Pyhton") == "Python"
+    assert TECH_MATCHER.lookup("Kubernets") == "Kubernetes"
+    assert TECH_MATCHER.lookup("Postgress") == "PostgreSQL"
+    print("✓ Misspelled technologies are corrected")
+
+    assert TECH_MATCHER.lookup("gp") is None
+    assert TECH_MATCHER.lookup("Berlin") is None
+    assert TECH_MATCHER.correct(["Django", "Elixir"]) == ["Django", "Elixir"]
+    print("✓ Short, known and unknown names are left as typed")
+
+
+def test_conversation_flow():
+    """Test the compiled screening flow."""
+    print("\nTesting screening flow...")
+
+    from backends import StubBackend
+    from chatbot import HiringAssistant
+    from conversation_flow import DEFAULT_FLOW, load_flow
+    from prompts import CANDIDATE_INFO_FIELDS
+
+    assert DEFAULT_FLOW.fields == [f['field'] for f in CANDIDATE_INFO_FIELDS]
+    assert DEFAULT_FLOW.validate('email', 'invalid-email')[0] == False
+    assert DEFAULT_FLOW.validate('tech_stack', 'Pyhton, Django') == (True, ['Python', 'Django'])
+    print("✓ Default flow compiled from CANDIDATE_INFO_FIELDS")
+
+    flow = load_flow('flows/intern.json')
+
+    def asked_fields(position):
+        assistant = HiringAssistant(api_key='', model=StubBackend(), flow=flow)
+        assistant.multi_field_extraction = False
+        answers = {'full_name': 'Ada Lovelace', 'email': 'ada@example.com', 'phone': '555-123-4567',
+                   'position': position, 'experience': '2 years', 'graduation_year': '2027',
+                   'location': 'London', 'tech_stack': 'Python'}
+        asked = []
+        while assistant.current_field_index < len(flow):
+            field = flow.states[assistant.current_field_index].field
+            asked.append(field)
+            assistant.process_user_response(answers[field])
+        return asked
+
+    assert asked_fields('Software Intern') == [
+        'full_name', 'email', 'phone', 'position', 'graduation_year', 'location', 'tech_stack']
+    assert asked_fields('Backend Developer') == [
+        'full_name', 'email', 'phone', 'position', 'experience', 'location', 'tech_stack']
+    print("✓ Branches and skip rules from a flow file are followed")
+
+    assistant = HiringAssistant(api_key='', model=StubBackend(), flow=flow)
+    assistant.process_user_response("Ann Lee, ann@example.com, +1 555 123 4567, Software Intern, Berlin, Python")
+    assert flow.states[assistant.current_field_index].field == 'graduation_year'
+    print("✓ Branches are followed for fields filled from a multi-field message")
+
+
+def test_history():
+    """Test bounded chat history."""
+    print("\nTesting chat history...")
+
+    from history import ChatHistory
+
+    history = ChatHistory(max_recent=5, block_size=3)
+    for i in range(20):
+        history.append({"role": "user", "content": f"message {i}"})
+
+    assert [m["content"] for m in history] == [f"message {i}" for i in range(15, 20)]
+    assert history.earlier_count == 15
+    assert [m["content"] for m in history.earlier_messages()] == [f"message {i}" for i in range(15)]
+    print("✓ Older messages are archived and inflated on demand")
+
+    capped = ChatHistory(max_recent=2, block_size=2, max_bytes=200)
+    for i in range(100):
+        capped.append({"role": "assistant", "content": f"validation error {i}"})
+    assert capped.memory_bytes() <= 200
+    assert capped.dropped_count > 0
+    print("✓ Session memory cap is enforced")
+
+    import random
+    rng = random.Random(0)
+    large = ChatHistory(max_bytes=256 * 1024)
+    for i in range(40):
+        large.append({"role": "user", "content": ''.join(rng.choice('abcdefghij ') for _ in range(20000))})
+    assert large.memory_bytes() <= 256 * 1024 and large.dropped_count > 0
+    assert len(list(large)[-1]["content"]) == 20000
+
+    large.append({"role": "assistant", "content": "x" * 500000})
+    assert large.memory_bytes() <= 256 * 1024
+    assert list(large)[-1]["content"].endswith("[message truncated]")
+
+    wide = ChatHistory(max_bytes=64 * 1024)
+    for i in range(40):
+        wide.append({"role": "user", "content": "名前🙂" * 2000})
+    wide.append({"role": "assistant", "content": "🙂" * 100000})
+    assert wide.memory_bytes() <= 64 * 1024
+    assert len(list(wide)[-1]["content"].encode('utf-8')) <= 16 * 1024
+    print("✓ Cap holds for large recent messages, and oversized messages are truncated")
+
+
+def test_single_flight():
+    """Test coalescing of identical in-flight generations."""
+    print("\nTesting single-flight coalescing...")
+
+    import asyncio
+    import threading
+    from backends import StubBackend
+    from chatbot import HiringAssistant
+    from coalescing import SingleFlight
+    from question_cache import QuestionCache
+
+    backend = StubBackend(latency=0.2)
+    flights = SingleFlight()
+    stacks = ["Python, Django, SQL", "django, sql, python", "React, TypeScript"]
+
+    def screen(stack):
+        assistant = HiringAssistant(api_key='', model=backend)
+        assistant.question_flights = flights
+        assistant.question_cache = QuestionCache()
+        assistant.candidate_data = {'tech_stack': stack.split(', ')}
+        assistant.current_field_index = 7
+        response, _ = assistant.process_user_response("ok")
+        assert "**" in response, response
+
+    threads = [threading.Thread(target=screen, args=(stacks[i % 3],)) for i in range(30)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert backend.calls == 2, f"Expected one backend call per distinct stack, got {backend.calls}"
+    assert flights.stats()['coalesced_calls'] == 28
+    print("✓ Burst of 30 screenings issued one backend call per distinct stack")
+
+    def failing():
+        raise RuntimeError("quota exceeded")
+
+    async def burst():
+        return await asyncio.gather(
+            *[flights.do_async('failing', failing) for _ in range(5)], return_exceptions=True)
+
+    errors = asyncio.run(burst())
+    assert all(isinstance(error, RuntimeError) for error in errors)
+    print("✓ Errors propagate to every coalesced caller")
+
+
+def test_micro_batching():
+    """Test micro-batching of question generation requests."""
+    print("\nTesting micro-batching...")
+
+    import threading
+    from backends import StubBackend, StubResponse
+    from batching import MicroBatcher
+
+    backend = StubBackend()
+    batcher = MicroBatcher(backend, window=0.2, max_batch_size=4)
+    stacks = ["Python", "Go", "React", "Docker", "Rust", "Java"]
+    results = {}
+
+    def request(stack):
+        results[stack] = batcher.generate(stack)
+
+    threads = [threading.Thread(target=request, args=(stack,)) for stack in stacks]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for stack in stacks:
+        assert results[stack].startswith(f"**{stack}**"), results[stack]
+    assert backend.calls == 2, f"Expected two combined calls, got {backend.calls}"
+    assert batcher.stats()['histogram'] == {4: 1, 2: 1}
+    print("✓ Six requests served by two combined calls")
+
+    class UnparseableBackend(StubBackend):
+        def generate_content(self, prompt):
+            if "[CANDIDATE" in prompt:
+                self.calls += 1
+                return StubResponse("free-form text without markers")
+            return super().generate_content(prompt)
+
+    broken = UnparseableBackend()
+    fallback_batcher = MicroBatcher(broken, window=0.2, max_batch_size=2)
+    threads = [threading.Thread(target=fallback_batcher.generate, args=(stack,)) for stack in stacks[:2]]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert broken.calls == 3 and fallback_batcher.stats()['fallbacks'] == 1
+    print("✓ Unparseable batch responses fall back to individual calls")
+
+
+def test_latency_controller():
+    """Test latency-budgeted generation planning."""
+    print("\nTesting latency controller...")
+
+    from backends import StubBackend
+    from chatbot import HiringAssistant
+    from latency_slo import SLOController, LatencyModel
+    from question_cache import QuestionCache
+
+    stack = ['Python', 'Django', 'SQL', 'Redis', 'Docker', 'AWS']
+
+    generous = SLOController(60.0, LatencyModel(overhead=1.0, seconds_per_token=0.01))
+    assert generous.plan(stack).questions_per_technology == 5
+
+    tight = SLOController(3.0, LatencyModel(overhead=1.0, seconds_per_token=0.01))
+    plan = tight.plan(stack)
+    assert plan.questions_per_technology == 2
+    assert plan.technologies == stack[:len(plan.technologies)] and plan.dropped
+    assert plan.predicted_seconds <= 3.0
+    print("✓ Questions and technologies are reduced to fit the target")
+
+    backend = StubBackend()
+    assistant = HiringAssistant(api_key='', model=backend)
+    assistant.latency_controller = tight
+    assistant.question_cache = QuestionCache()
+    assistant.candidate_data = {'tech_stack': stack}
+    assistant.current_field_index = len(assistant.flow)
+    response, _ = assistant.process_user_response("ok")
+
+    assert "EXACTLY 2 questions per technology" in backend.prompts[-1]
+    assert response.count("**") == 2 * len(plan.technologies)
+    assert tight.stats()['decisions'] == 2
+    print("✓ Plans are applied to the prompt and reported in metrics")
+
+
+def test_similarity_cache():
+    """Test serving overlapping tech stacks from cached technology blocks."""
+    print("\nTesting similarity-aware question cache...")
+
+    from backends import StubBackend
+    from chatbot import HiringAssistant
+    from question_cache import SimilarityQuestionCache
+
+    backend = StubBackend()
+    cache = SimilarityQuestionCache(max_entries=2)
+
+    def screen(technologies):
+        assistant = HiringAssistant(api_key='', model=backend)
+        assistant.question_cache = cache
+        assistant.candidate_data = {'tech_stack': technologies}
+        assistant.current_field_index = len(assistant.flow)
+        return assistant.process_user_response("ok")[0]
+
+    screen(['Python', 'Django', 'SQL'])
+    response = screen(['Python', 'Django', 'PostgreSQL'])
+    assert backend.calls == 2 and "tech stack: PostgreSQL\n" in backend.prompts[-1]
+    assert response.index("**Python**") < response.index("**Django**") < response.index("**PostgreSQL**")
+    assert cache.stats()['partial_hits'] == 1 and cache.stats()['blocks_served'] == 2
+    print("✓ Only technologies missing from cached blocks are generated")
+
+    screen(['Django', 'Python'])
+    assert backend.calls == 2
+    screen(['Go'])
+    assert cache.stats()['evictions'] == 2
+    assert cache.cover((('postgresql', 'sql'), '3-5', False)) == ({}, ['postgresql', 'sql'])
+    print("✓ Evicted entries leave the technology index")
+
+
+def test_returning_candidates():
+    """Test resuming recently completed screenings."""
+    print("\nTesting returning-candidate index...")
+
+    from backends import StubBackend
+    from chatbot import HiringAssistant
+    from question_cache import QuestionCache
+    from returning_candidates import ReturningCandidateIndex
+
+    now = [0.0]
+    index = ReturningCandidateIndex(ttl_seconds=60, max_entries=2, clock=lambda: now[0])
+    backend = StubBackend()
+
+    def screen(email, phone, name="Jane Doe"):
+        assistant = HiringAssistant(api_key='', model=backend)
+        assistant.question_cache = QuestionCache()
+        assistant.returning_candidates = index
+        responses = [assistant.process_user_response(message)[0]
+                     for message in [name, email, phone, "5", "Engineer", "Berlin", "Python", "ok"]]
+        return assistant, responses
+
+    first, responses = screen("jane@example.com", "+1 555 123 4567")
+    assert first.tech_questions_generated and backend.calls == 1
+    assert index.stats()['misses'] == 1
+
+    resumed, responses = screen("JANE@example.com", "15551234567")
+    assert "Welcome back, Jane Doe" in responses[2] and "**Python**" in responses[2]
+    assert resumed.tech_questions_generated and backend.calls == 1
+    assert resumed.candidate_data == {'full_name': 'Jane Doe', 'email': 'JANE@example.com', 'phone': '15551234567'}
+    print("✓ Returning candidates are resumed without a second generation")
+
+    impostor, responses = screen("jane@example.com", "+1 555 123 4567", name="Mallory")
+    assert "Welcome back, Mallory" in responses[2] and "Jane" not in responses[2] and "Berlin" not in responses[2]
+    assert impostor.candidate_data['full_name'] == "Mallory" and not impostor.answers
+    print("✓ Only the generated questions are restored, not earlier details or answers")
+
+    screen("jane@example.com", "+1 555 000 0000")
+    assert backend.calls == 2
+    print("✓ Email and phone must both match")
+
+    screen("sam@example.com", "+1 555 999 9999")
+    assert index.stats()['evictions'] == 1
+    now[0] = 61
+    assert index.lookup("sam@example.com", "+1 555 999 9999") is None
+    assert index.stats()['expirations'] == 2 and len(index) == 0
+    print("✓ Entries are bounded in number and expire after the TTL")
+
+    collector = HiringAssistant(api_key='', model=backend)
+    collector.question_cache = QuestionCache()
+    collector.returning_candidates = ReturningCandidateIndex()
+    collector.collect_answers = True
+    for message in ["Ann Lee", "ann@example.com", "+1 555 222 3333", "5", "Engineer", "Berlin", "Go", "ok"]:
+        collector.process_user_response(message)
+    while collector.conversation_active and collector.process_user_response("I would profile it first")[1]:
+        pass
+    assert "**Go**" in collector.returning_candidates.lookup("ann@example.com", "+1 555 222 3333")
+    assert "Keywords" not in collector.returning_candidates.lookup("ann@example.com", "+1 555 222 3333")
+    print("✓ Sessions collecting answers store their questions for resuming")
+
+
+def test_analytics():
+    """Test the columnar analytics store of completed screenings."""
+    print("\nTesting screening analytics...")
+
+    from analytics import CandidateAnalytics, MIN_CAPACITY
+    from backends import StubBackend
+    from chatbot import HiringAssistant
+    from question_cache import QuestionCache
+
+    now = [1000.0]
+    store = CandidateAnalytics(retention_seconds=3600, clock=lambda: now[0])
+
+    assistant = HiringAssistant(api_key='', model=StubBackend())
+    assistant.question_cache = QuestionCache()
+    assistant.analytics = store
+    for message in ["Jane Doe", "jane@example.com", "+1 555 123 4567", "5 years",
+                    "Backend Engineer", "Berlin", "py, Django", "ok"]:
+        assistant.process_user_response(message)
+
+    store.add({'experience': '2', 'position': 'backend  engineer', 'location': 'berlin',
+               'tech_stack': ['Python']})
+    store.add({'experience': 'many', 'position': 'Data Scientist', 'location': 'Paris',
+               'tech_stack': 'Python, Pandas'})
+
+    assert store.count() == 3
+    assert store.top_technologies(1) == [('Python', 3)]
+    assert store.location_counts() == [('Berlin', 2), ('Paris', 1)]
+    summary = store.experience_by_position()
+    assert list(summary) == ['Backend Engineer'] and summary['Backend Engineer']['median'] == 3.5
+    assert sum(count for _, count in store.experience_histogram()) == 2
+    print("✓ Aggregates group categories and skip unparseable experience")
+
+    now[0] += 1800
+    store.add({'experience': '1', 'position': 'QA', 'location': 'Remote', 'tech_stack': ['Go']})
+    assert store.count(since=now[0] - 60) == 1
+    now[0] += 1801
+    assert store.count() == 1 and store.top_technologies() == [('Go', 1)]
+    print("✓ Screenings expire after the retention window")
+
+    store.add_many([{'experience': '3', 'position': f"Role {i}", 'location': f"Town {i}",
+                     'tech_stack': ['Go', f"Tech {i}"]} for i in range(MIN_CAPACITY)])
+    now[0] += 3601
+    store.add({'experience': '4', 'position': 'QA', 'location': 'Remote', 'tech_stack': ['Rust', 'Go']})
+    stats = store.stats()
+    assert (stats['positions'], stats['locations'], stats['technologies']) == (1, 1, 2)
+    assert store.top_technologies() == [('Go', 1), ('Rust', 1)]
+    assert store.location_counts() == [('Remote', 1)] and list(store.experience_by_position()) == ['QA']
+    print("✓ Categories used only by expired screenings are dropped on compaction")
+
+
+def test_answer_scoring():
+    """Test answer collection and local keyword scoring."""
+    print("\nTesting answer scoring...")
+
+    import json
+    from answer_scoring import KeywordScorer, parse_questions
+    from backends import StubBackend
+    from chatbot import HiringAssistant
+    from question_cache import QuestionCache
+
+    questions = parse_questions("**Python**\n1. What is the GIL?\n   Keywords: global interpreter lock, threads\n"
+                                "2. How do you manage dependencies?")
+    assert questions[0]['keywords'] == ['global interpreter lock', 'threads']
+    assert questions[1]['keywords'], "Keywords should fall back to the question's content words"
+
+    scorer = KeywordScorer([q['keywords'] for q in questions])
+    scores = scorer.score([0, 0, 1], ["The global interpreter lock serializes thread execution",
+                                      "No idea", "I pin each dependency"])
+    assert list(scores.round(2)) == [1.0, 0.0, 0.5], f"Unexpected scores: {scores}"
+    print("✓ Answers are scored against expected concepts in one batch")
+
+    backend = StubBackend()
+    assistant = HiringAssistant(api_key='', model=backend)
+    assistant.collect_answers = True
+    assistant.question_cache = QuestionCache()
+    assistant.candidate_data = {'tech_stack': ['Python']}
+    assistant.current_field_index = len(assistant.flow)
+
+    response, should_continue = assistant.process_user_response("ok")
+    assert should_continue and "Keywords:" not in response and "Question 1 of 4" in response
+
+    for _ in range(3):
+        _, should_continue = assistant.process_user_response("Check the exit code, then use profiling and caching")
+        assert should_continue
+    _, should_continue = assistant.process_user_response("Monitoring alerts led me to the root cause")
+    assert not should_continue
+    assert len(assistant.answers) == 4 and assistant.answers[2]['score'] > 0
+    assert json.loads(assistant.export_answers())['answers'][3]['matched_keywords'] == ['root cause', 'monitoring']
+    assert assistant.export_answers('csv').count('\n') == 5
+    candidate_copy = assistant.export_answers('json', include_scores=False)
+    assert 'score' not in candidate_copy and 'keywords' not in candidate_copy
+    assert 'score' not in assistant.export_answers('csv', include_scores=False)
+    print("✓ Sessions stay open for answers, and scores are kept in state and exportable")
+
+
+def test_cassette_backends():
+    """Test record/replay of backend responses."""
+    print("\nTesting cassette record/replay...")
+
+    import os
+    import tempfile
+    import time
+    from backends import StubBackend, RecordingBackend, ReplayBackend, CassetteMissError
+
+    with tempfile.TemporaryDirectory() as cassette_dir:
+        path = os.path.join(cassette_dir, 'gemini.jsonl.gz')
+        recorder = RecordingBackend(StubBackend(latency=0.1), path)
+        recorded = [recorder.generate_content(f"tech stack: {tech}").text for tech in ["Python", "Go"]]
+
+        replay = ReplayBackend(path)
+        start = time.perf_counter()
+        assert replay.generate_content("tech stack: Python").text == recorded[0]
+        assert time.perf_counter() - start >= 0.09
+        print("✓ Recorded responses replay with recorded latency")
+
+        chunks = list(ReplayBackend(path, time_scale=0).generate_content("tech stack: Go", stream=True))
+        assert len(chunks) > 1 and ''.join(chunk.text for chunk in chunks) == recorded[1]
+        print("✓ Streams replay chunk by chunk")
+
+        try:
+            replay.generate_content("tech stack: Rust")
+            assert False, "Expected a cassette miss"
+        except CassetteMissError:
+            pass
+        lenient = ReplayBackend(path, time_scale=0, strict=False)
+        assert lenient.generate_content("tech stack: Rust").text in recorded
+        print("✓ Unknown prompts raise when strict and reuse recordings otherwise")
+
+
+def test_warm_up():
+    """Test startup warm-up and question pre-generation."""
+    print("\nTesting warm-up...")
+
+    from backends import StubBackend
+    from chatbot import HiringAssistant
+    from question_cache import QuestionCache
+    from warmup import warm_up, top_stacks
+
+    stacks = ["Python, Django, SQL", "python django sql", "Pyhton, Djnago, SQL", "React, TypeScript", "Go"]
+    assert top_stacks(stacks, 1) == [['Python', 'Django', 'SQL']]
+    print("✓ Most common stacks are normalized and ranked")
+
+    backend = StubBackend()
+    report = warm_up(model=backend, stacks=stacks, top_n=2)
+    assert [step['step'] for step in report.steps][:2] == ['compile validators', 'load indexes']
+    assert backend.calls == 2
+
+    assistant = HiringAssistant(api_key='', model=report.model)
+    assistant.candidate_data = {'tech_stack': ['SQL', 'Django', 'Python']}
+    assistant.current_field_index = len(assistant.flow)
+    assistant.process_user_response("ok")
+    assert backend.calls == 2
+    print("✓ Pre-generated questions serve the first candidate from cache")
+
+    class FailingBackend(StubBackend):
+        def generate_content(self, prompt, generation_config=None, stream=False):
+            if 'React' in prompt:
+                self.calls += 1
+                raise RuntimeError("quota exceeded")
+            return super().generate_content(prompt, generation_config)
+
+    backend = FailingBackend()
+    report = warm_up(model=backend, stacks=["React, TypeScript", "Go"], top_n=2,
+                     question_cache=QuestionCache())
+    assert [step['step'] for step in report.errors] == ['generate React, TypeScript']
+    assert "quota exceeded" in report.errors[0]['error']
+    assert report.model is backend and backend.calls == 2
+    print("✓ Backend errors during pre-generation are recorded and skipped")
+
+
+def test_profiling():
+    """Test opt-in per-session profiling."""
+    print("\nTesting profiling hooks...")
+
+    import os
+    import pstats
+    import tempfile
+    import tracemalloc
+    from backends import StubBackend
+    from chatbot import HiringAssistant
+    from profiling import SessionProfiler
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        assistant = HiringAssistant(api_key='', model=StubBackend())
+        assistant.profiler = SessionProfiler(output_dir, session_id='test')
+
+        with assistant.profiler.capture('rerun'):
+            assistant.process_user_response("John Doe")
+        assistant.process_user_response("john@example.com")
+
+        assert [c['label'] for c in assistant.profiler.captures] == ['rerun', 'process_user_response']
+        for capture in assistant.profiler.captures:
+            pstats.Stats(capture['path'] + '.pstats')
+            tracemalloc.Snapshot.load(capture['path'] + '.tracemalloc')
+        assert len(os.listdir(output_dir)) == 4
+        assert not tracemalloc.is_tracing()
+    print("✓ Profiles and memory snapshots written per capture")
+
+    import cProfile
+    with tempfile.TemporaryDirectory() as output_dir:
+        profiler = SessionProfiler(output_dir, session_id='busy')
+        other = cProfile.Profile()
+        other.enable()
+        try:
+            with profiler.capture('rerun'):
+                pass
+        finally:
+            other.disable()
+        with profiler.capture('rerun'):
+            pass
+        assert len(profiler.captures) + profiler.skipped == 2 and profiler.captures
+        assert not tracemalloc.is_tracing()
+    print("✓ A capture that cannot start leaves the profiler usable")
+
+
 def test_prompts():
     """Test prompt templates exist."""
     print("\nTesting prompt templates...")
@@ -93,6 +680,20 @@ if __name__ == "__main__":
 
     try:
         test_utils()
+        test_extraction()
+        test_tech_matching()
+        test_conversation_flow()
+        test_history()
+        test_single_flight()
+        test_micro_batching()
+        test_latency_controller()
+        test_similarity_cache()
+        test_answer_scoring()
+        test_returning_candidates()
+        test_analytics()
+        test_cassette_backends()
+        test_warm_up()
+        test_profiling()
         test_prompts()
 
         print("\n" + "=" * 60)
@@ -4,7 +4,38 @@ This module contains helper functions for input validation and parsing.
 """
 
 import re
-from typing import List
+from typing import List, Optional, Tuple
+
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+PHONE_STRIP_PATTERN = re.compile(r'[\s\-\(\)\+]')
+EXPERIENCE_UNIT_PATTERN = re.compile(r'\s*(years?|yrs?)\s*')
+
+TECH_ALIASES = {
+    'python': 'Python', 'py': 'Python',
+    'java': 'Java',
+    'javascript': 'JavaScript', 'js': 'JavaScript',
+    'typescript': 'TypeScript', 'ts': 'TypeScript',
+    'go': 'Go', 'golang': 'Go',
+    'rust': 'Rust',
+    'c': 'C', 'c++': 'C++', 'cpp': 'C++', 'c#': 'C#', 'csharp': 'C#',
+    'ruby': 'Ruby', 'php': 'PHP', 'swift': 'Swift', 'kotlin': 'Kotlin', 'scala': 'Scala',
+    'html': 'HTML', 'css': 'CSS',
+    'sql': 'SQL', 'postgresql': 'PostgreSQL', 'postgres': 'PostgreSQL',
+    'mysql': 'MySQL', 'sqlite': 'SQLite', 'mongodb': 'MongoDB', 'mongo': 'MongoDB',
+    'redis': 'Redis', 'elasticsearch': 'Elasticsearch',
+    'django': 'Django', 'flask': 'Flask', 'fastapi': 'FastAPI', 'spring': 'Spring',
+    'rails': 'Rails', 'laravel': 'Laravel',
+    'react': 'React', 'reactjs': 'React', 'angular': 'Angular', 'vue': 'Vue', 'vuejs': 'Vue',
+    'node': 'Node.js', 'nodejs': 'Node.js', 'node.js': 'Node.js', 'express': 'Express',
+    'graphql': 'GraphQL',
+    'docker': 'Docker', 'kubernetes': 'Kubernetes', 'k8s': 'Kubernetes',
+    'terraform': 'Terraform', 'ansible': 'Ansible', 'jenkins': 'Jenkins',
+    'aws': 'AWS', 'gcp': 'GCP', 'azure': 'Azure',
+    'linux': 'Linux', 'git': 'Git',
+    'kafka': 'Kafka', 'rabbitmq': 'RabbitMQ', 'spark': 'Spark', 'hadoop': 'Hadoop',
+    'pandas': 'Pandas', 'numpy': 'NumPy', 'tensorflow': 'TensorFlow', 'pytorch': 'PyTorch',
+    'scikit-learn': 'scikit-learn', 'sklearn': 'scikit-learn',
+}
 
 
 def parse_tech_stack(tech_stack_input: str) -> List[str]:
@@ -39,6 +70,46 @@ def parse_tech_stack(tech_stack_input: str) -> List[str]:
     return technologies
 
 
+def normalize_tech_name(name: str) -> Optional[str]:
+    """
+    Map a technology name or alias to its canonical spelling.
+
+    Args:
+        name: Technology name as typed by the candidate
+
+    Returns:
+        Canonical technology name, or None if the name is not a known alias
+
+    Examples:
+        >>> normalize_tech_name("golang")
+        'Go'
+    """
+    return TECH_ALIASES.get(name.strip().lower())
+
+
+def tech_stack_key(technologies: List[str]) -> Tuple[str, ...]:
+    """
+    Build an order- and spelling-insensitive key for a tech stack.
+    Known aliases are mapped to their canonical name; duplicates are removed.
+
+    Args:
+        technologies: Parsed technology names
+
+    Returns:
+        Sorted tuple of lowercase technology names
+
+    Examples:
+        >>> tech_stack_key(['golang', 'Python', 'py'])
+        ('go', 'python')
+    """
+    canonical = set()
+    for tech in technologies:
+        name = normalize_tech_name(tech) or tech.strip()
+        if name:
+            canonical.add(name.lower())
+    return tuple(sorted(canonical))
+
+
 def validate_email(email: str) -> bool:
     """
     Validate email format using regex pattern.
@@ -49,8 +120,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if email format is valid, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(EMAIL_PATTERN.match(email))
 
 
 def validate_phone(phone: str) -> bool:
@@ -64,7 +134,7 @@ def validate_phone(phone: str) -> bool:
     Returns:
         True if phone format is valid, False otherwise
     """
-    cleaned = re.sub(r'[\s\-\(\)\+]', '', phone)
+    cleaned = PHONE_STRIP_PATTERN.sub('', phone)
     return len(cleaned) >= 10 and cleaned.isdigit()
 
 
@@ -79,22 +149,40 @@ def validate_experience(experience: str) -> bool:
     Returns:
         True if experience format is valid, False otherwise
     """
+    return parse_experience(experience) is not None
+
+
+def parse_experience(experience: str) -> Optional[float]:
+    """
+    Parse years of experience using the same rules as validate_experience.
+
+    Args:
+        experience: Experience string such as "5", "2.5 years" or "3 yrs"
+
+    Returns:
+        Years as a float between 0 and 50, or None if the input is invalid
+    """
     cleaned = experience.strip().lower()
-    cleaned = re.sub(r'\s*(years?|yrs?)\s*', '', cleaned)
+    cleaned = EXPERIENCE_UNIT_PATTERN.sub('', cleaned)
 
     try:
         exp_value = float(cleaned)
-        return 0 <= exp_value <= 50
     except ValueError:
-        return False
+        return None
+
+    if 0 <= exp_value <= 50:
+        return exp_value
+    return None
 
 
-def is_exit_command(user_input: str) -> bool:
+def is_exit_command(user_input: str, exact: bool = False) -> bool:
     """
     Check if user input indicates intent to exit the conversation.
 
     Args:
         user_input: User's message
+        exact: Only match messages consisting of an exit keyword, so free-text
+            answers mentioning e.g. an "exit code" do not end the conversation
 
     Returns:
         True if input contains exit keywords, False otherwise
@@ -102,9 +190,25 @@ def is_exit_command(user_input: str) -> bool:
     exit_keywords = ['exit', 'quit', 'bye', 'thank you', 'thanks']
     user_input_lower = user_input.lower().strip()
 
+    if exact:
+        return user_input_lower.rstrip('.!') in exit_keywords
+
     return any(keyword in user_input_lower for keyword in exit_keywords)
 
 
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of LLM tokens in a text (about four characters per token).
+
+    Args:
+        text: Prompt or response text
+
+    Returns:
+        Estimated token count, at least 1
+    """
+    return max(1, len(text) // 4)
+
+
 def format_candidate_summary(candidate_data: dict) -> str:
     """
     Format candidate data into a readable summary.
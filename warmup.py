@@ -0,0 +1,271 @@
+"""
+TalentScout Hiring Assistant - Startup Warm-Up
+This module runs the cold paths once at startup so the first candidate after a
+deploy sees steady-state latency: SDK import and client construction, regex and
+validator compilation, tech alias and flow indexes, and optionally question
+generation for the most common tech stacks.
+
+Run from the command line with:
+    python warmup.py --stacks common_stacks.txt --top 20
+
+The app runs the same warm-up once per process at startup. The command-line
+run warms only its own process; use it to measure cold-start costs.
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_TOP_N = 10
+
+
+class WarmUpReport:
+    """
+    Result of a warm-up run: the prepared backend and per-step timings.
+    """
+
+    def __init__(self):
+        self.model = None
+        self.steps: List[Dict] = []
+
+    def timed(self, name: str, fn: Callable):
+        """
+        Run one warm-up step and record how long it took.
+
+        Args:
+            name: Step name
+            fn: Zero-argument callable performing the step
+
+        Returns:
+            Result of fn
+        """
+        start = time.perf_counter()
+        result = fn()
+        self.steps.append({'step': name, 'seconds': time.perf_counter() - start})
+        return result
+
+    def attempt(self, name: str, fn: Callable):
+        """
+        Run one optional warm-up step, recording a failure instead of raising it.
+
+        Args:
+            name: Step name
+            fn: Zero-argument callable performing the step
+
+        Returns:
+            Result of fn, or None if it failed
+        """
+        start = time.perf_counter()
+        try:
+            result = fn()
+        except Exception as e:
+            self.steps.append({'step': name, 'seconds': time.perf_counter() - start, 'error': str(e)})
+            return None
+        self.steps.append({'step': name, 'seconds': time.perf_counter() - start})
+        return result
+
+    @property
+    def errors(self) -> List[Dict]:
+        """
+        Steps that failed.
+        """
+        return [step for step in self.steps if 'error' in step]
+
+    @property
+    def total_seconds(self) -> float:
+        """
+        Total time spent in warm-up steps.
+        """
+        return sum(step['seconds'] for step in self.steps)
+
+
+def _create_gemini_model(api_key: str):
+    """
+    Configure the Gemini SDK and construct the model client.
+
+    Args:
+        api_key: Google Gemini API key
+
+    Returns:
+        GenerativeModel instance
+    """
+    import google.generativeai as genai
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel('gemini-pro')
+
+
+def _compile_validators():
+    """
+    Import the parsing modules and exercise every validator once, so module-level
+    patterns are compiled and the regex cache is populated.
+    """
+    from extraction import extract_candidate_fields
+    from utils import (
+        sanitize_input,
+        validate_email,
+        validate_phone,
+        validate_experience,
+        is_exit_command
+    )
+
+    sanitize_input("<warm-up>")
+    validate_email("warm.up@example.com")
+    validate_phone("+1 555 123 4567")
+    validate_experience("5 years")
+    is_exit_command("hello")
+    extract_candidate_fields(
+        "Jane Doe, jane@example.com, +1 555 123 4567, 5 years, backend engineer, Berlin, Pyhton Go",
+        ['full_name', 'email', 'phone', 'experience', 'position', 'location', 'tech_stack'])
+
+
+def _load_indexes(flow_path: Optional[str]):
+    """
+    Build the tech alias matcher index and compile the screening flow.
+
+    Args:
+        flow_path: Optional JSON flow file to compile as well
+
+    Returns:
+        Compiled flow for flow_path, or the default flow
+    """
+    from conversation_flow import DEFAULT_FLOW, load_flow
+    from tech_matching import TECH_MATCHER
+
+    TECH_MATCHER.lookup("kubernets")
+    if flow_path:
+        return load_flow(flow_path)
+    return DEFAULT_FLOW
+
+
+def top_stacks(stacks: List[str], top_n: int) -> List[List[str]]:
+    """
+    Find the most common normalized tech stacks in a supplied list.
+
+    Args:
+        stacks: Raw tech stack strings, one per candidate
+        top_n: Number of stacks to return
+
+    Returns:
+        Normalized technology lists, most common first
+    """
+    from conversation_flow import NORMALIZERS
+    from utils import tech_stack_key
+
+    normalize = NORMALIZERS['tech_stack']
+    counts = Counter()
+    representative = {}
+    for stack in stacks:
+        technologies = normalize(stack)
+        if not technologies:
+            continue
+        key = tech_stack_key(technologies)
+        counts[key] += 1
+        representative.setdefault(key, technologies)
+
+    return [representative[key] for key, _ in counts.most_common(top_n)]
+
+
+def warm_up(api_key: Optional[str] = None, model=None, stacks: Optional[List[str]] = None,
+            top_n: int = DEFAULT_TOP_N, flow_path: Optional[str] = None,
+            latency_controller=None, collect_answers: bool = False,
+            question_cache=None) -> WarmUpReport:
+    """
+    Run every warm-up step and report its duration. Question pre-generation is
+    best-effort: a backend error for one stack is recorded on its step and the
+    remaining stacks are still tried.
+
+    Args:
+        api_key: Gemini API key, used when no model is supplied
+        model: Pre-built backend (e.g. a replay backend); skips SDK steps
+        stacks: Optional list of tech stack strings to pre-generate questions for
+        top_n: Number of most common stacks to pre-generate
+        flow_path: Optional screening flow file to compile
+        latency_controller: Controller used by live sessions, so pre-generated
+            questions are cached under the same plan as live requests
+        collect_answers: Pre-generate questions with answer keywords, matching
+            sessions that collect and score answers
+        question_cache: Cache used by live sessions, if not the default one
+
+    Returns:
+        WarmUpReport with the backend model (None without model or API key) and step timings
+    """
+    report = WarmUpReport()
+
+    if model is None and api_key:
+        report.timed('import SDK', lambda: __import__('google.generativeai'))
+        model = report.timed('create client', lambda: _create_gemini_model(api_key))
+    report.model = model
+
+    report.timed('compile validators', _compile_validators)
+    report.timed('load indexes', lambda: _load_indexes(flow_path))
+
+    if stacks and model is not None:
+        from chatbot import HiringAssistant
+
+        assistant = HiringAssistant(api_key or '', model=model)
+        assistant.latency_controller = latency_controller
+        assistant.collect_answers = collect_answers
+        if question_cache is not None:
+            assistant.question_cache = question_cache
+        for technologies in top_stacks(stacks, top_n):
+            report.attempt(f"generate {', '.join(technologies)}",
+                         lambda technologies=technologies: assistant.prefetch_questions(technologies))
+
+    return report
+
+
+def read_stacks(path: str) -> List[str]:
+    """
+    Read tech stacks from a file with one candidate's stack per line.
+
+    Args:
+        path: Stack list file
+
+    Returns:
+        List of non-empty lines
+    """
+    with open(path, 'r') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point.
+
+    Args:
+        argv: Command-line arguments
+
+    Returns:
+        Process exit code
+    """
+    parser = argparse.ArgumentParser(description="Warm up TalentScout caches and compiled structures.")
+    parser.add_argument('--stacks', help="File with one tech stack per line to pre-generate questions for")
+    parser.add_argument('--top', type=int, default=DEFAULT_TOP_N, help="Number of most common stacks")
+    parser.add_argument('--flow', default=os.getenv('SCREENING_FLOW'), help="Screening flow JSON file")
+    parser.add_argument('--replay', default=os.getenv('LLM_CASSETTE_REPLAY'), help="Replay cassette instead of Gemini")
+    args = parser.parse_args(argv)
+
+    model = None
+    if args.replay:
+        from backends import ReplayBackend
+        model = ReplayBackend(args.replay, strict=False)
+
+    api_key = os.getenv('GEMINI_API_KEY')
+    if model is None and not api_key and args.stacks:
+        print("GEMINI_API_KEY not found; questions will not be pre-generated.")
+
+    stacks = read_stacks(args.stacks) if args.stacks else None
+    report = warm_up(api_key, model=model, stacks=stacks, top_n=args.top, flow_path=args.flow)
+
+    for step in report.steps:
+        error = f"  (failed: {step['error']})" if 'error' in step else ''
+        print(f"{step['seconds'] * 1000:>10.1f} ms  {step['step']}{error}")
+    print(f"{report.total_seconds * 1000:>10.1f} ms  total")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())